@@ -4,154 +4,498 @@ Claude 2025 Wrapped - Conversation Analysis Script
 Analyzes exported Claude conversation data to generate Spotify Wrapped-style insights
 """
 
+import argparse
 import json
+import mmap
+import pickle
+import sys
 from collections import Counter, defaultdict
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache
+from heapq import heappush, heapreplace, nlargest
+from itertools import islice
+from multiprocessing import Pool
+from operator import itemgetter
 import re
 from pathlib import Path
 
+# Optional: faster JSON parsing and writing with orjson when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: stream conversations.json with ijson when installed, preferring
+# its C backend; the pure-Python one (e.g. under PyPy) still streams
+try:
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+
+# Optional: match topic keywords with an Aho-Corasick automaton when installed
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Paths
 RAW_DIR = Path(__file__).parent / "raw-exports"
 ANALYSIS_DIR = Path(__file__).parent / "analysis"
 OUTPUT_DIR = Path(__file__).parent / "output"
+CONVERSATIONS_CACHE = ANALYSIS_DIR / ".conversations.pickle"
 
 # Ensure output directories exist
 ANALYSIS_DIR.mkdir(exist_ok=True)
 OUTPUT_DIR.mkdir(exist_ok=True)
 
 
-def load_conversations(year_filter=None):
-    """Load and return conversations data, optionally filtered by year"""
-    with open(RAW_DIR / "conversations.json", "r") as f:
-        convos = json.load(f)
+def load_json(path):
+    """Parse a JSON file, using orjson when available"""
+    if orjson:
+        return orjson.loads(path.read_bytes())
+    with open(path, "rb") as f:
+        return json.load(f)
+
+
+def load_json_mapped(path):
+    """
+    Parse a large JSON file with orjson straight from a read-only memory map,
+    so the file is never copied into a bytes object (peak memory drops by
+    roughly the file size). Falls back to load_json without orjson.
+    """
+    if not orjson:
+        return load_json(path)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+        return orjson.loads(view)
+
+
+def save_json(path, obj):
+    """Write obj to path as indented JSON, using orjson when available"""
+    if orjson:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, "w") as f:
+            json.dump(obj, f, indent=2)
+
+
+def conversations_source():
+    """Path of the conversations export to read
 
-    if year_filter:
-        convos = [c for c in convos if c.get("created_at", "").startswith(str(year_filter))]
+    raw-exports/conversations.jsonl wins unless it is older than
+    conversations.json, so a fresh export dropped in next to a stale .jsonl
+    is not silently ignored.
+    """
+    jsonl_path = RAW_DIR / "conversations.jsonl"
+    json_path = RAW_DIR / "conversations.json"
+    if not jsonl_path.exists():
+        return json_path
+    if json_path.exists() and jsonl_path.stat().st_mtime_ns < json_path.stat().st_mtime_ns:
+        print(f"⚠️  {jsonl_path.name} is older than {json_path.name}; reading {json_path.name}")
+        return json_path
+    return jsonl_path
+
+
+def load_conversations(year_filter=None, path=None):
+    """Yield conversations one at a time, optionally filtered by year
+
+    Prefers an up-to-date raw-exports/conversations.jsonl (one conversation
+    per line, e.g. from `jq -c '.[]' conversations.json`), where lines that
+    can't belong to the requested year are skipped without being parsed.
+    Otherwise, with ijson installed the export is parsed incrementally, so
+    conversations from other years are never held in memory alongside the
+    ones we keep.
+    """
+    prefix = str(year_filter) if year_filter else ""
+    path = path or conversations_source()
+    if path.suffix == ".jsonl":
+        # A matching conversation's created_at contains '"<year>', so lines
+        # without it are rejected with a byte search; the rest get verified
+        needle = f'"{prefix}'.encode()
+        loads = orjson.loads if orjson else json.loads
+        with open(path, "rb") as f:
+            for line in f:
+                if needle in line and line.strip():
+                    convo = loads(line)
+                    if convo.get("created_at", "").startswith(prefix):
+                        yield convo
+        return
+
+    if ijson:
+        with open(path, "rb") as f:
+            convos = ijson.items(f, "item", use_float=True)
+            yield from (c for c in convos if c.get("created_at", "").startswith(prefix))
+    else:
+        yield from (c for c in load_json_mapped(path) if c.get("created_at", "").startswith(prefix))
+
+
+def load_conversations_cached(year_filter=None):
+    """Yield the filtered conversations, reusing a pickle of the last parse
+
+    The cache is keyed on the source file's name, mtime and size plus the year
+    filter, so replacing the export (or switching to the .jsonl) re-parses it.
+    The key is pickled ahead of the conversations, which lets a stale cache be
+    rejected without loading the rest of the file. Conversations are pickled
+    one at a time as they stream past and read back the same way, so only one
+    is held in memory either way.
+    """
+    source = conversations_source()
+    st = source.stat()
+    # The leading 2 is the cache layout (one pickle per conversation); it
+    # makes caches that hold the whole list as a single pickle look stale
+    key = (2, source.name, st.st_mtime_ns, st.st_size, year_filter)
 
-    return convos
+    try:
+        f = open(CONVERSATIONS_CACHE, "rb")
+    except OSError:
+        pass
+    else:
+        with f:
+            try:
+                hit = pickle.load(f) == key
+            except (EOFError, pickle.UnpicklingError):
+                hit = False
+            if hit:
+                while True:
+                    try:
+                        yield pickle.load(f)
+                    except EOFError:
+                        return
+
+    # Written under a temporary name and moved into place only once every
+    # conversation is in it, so an interrupted run never leaves a short cache.
+    # Separate dump() calls share no memo, so nothing accumulates between them
+    partial = CONVERSATIONS_CACHE.with_name(CONVERSATIONS_CACHE.name + ".tmp")
+    with open(partial, "wb") as f:
+        pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+        for convo in load_conversations(year_filter, source):
+            pickle.dump(convo, f, protocol=pickle.HIGHEST_PROTOCOL)
+            yield convo
+    partial.replace(CONVERSATIONS_CACHE)
 
 
 def load_projects():
     """Load and return projects data"""
-    with open(RAW_DIR / "projects.json", "r") as f:
-        return json.load(f)
+    return load_json(RAW_DIR / "projects.json")
 
 
 def load_memories():
     """Load and return memories data"""
-    with open(RAW_DIR / "memories.json", "r") as f:
-        return json.load(f)
+    return load_json(RAW_DIR / "memories.json")
 
 
-def count_words(text):
-    """Count words in text"""
-    if not text:
-        return 0
-    return len(text.split())
-
-
-def extract_hour(timestamp):
-    """Extract hour from ISO timestamp, converted to US Central time"""
-    if not timestamp:
-        return None
+@lru_cache(maxsize=512)
+def utc_weekday(day):
+    """Weekday (0=Monday) of a YYYY-MM-DD date string, or None if it isn't a
+    real date; a year has few unique days"""
     try:
-        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        # Convert from UTC to Central Time (UTC-6, ignoring DST for simplicity)
-        central_hour = (dt.hour - 6) % 24
-        return central_hour
-    except:
+        return date(int(day[0:4]), int(day[5:7]), int(day[8:10])).weekday()
+    except ValueError:
         return None
 
 
-def extract_weekday(timestamp):
-    """Extract weekday from ISO timestamp, converted to US Central time"""
-    if not timestamp:
-        return None
-    try:
-        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-        # Adjust for Central Time - if hour < 6, it's previous day in Central
-        central_hour = dt.hour - 6
-        day_adjust = -1 if central_hour < 0 else 0
-        return (dt.weekday() + day_adjust) % 7
-    except:
-        return None
+WEEKDAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
 
+TOPIC_KEYWORDS = (
+    ("Work - Duckbill", ("duckbill", "gmv", "influencer", "tagline", "billboard", "marketing copy", "pricing strategy")),
+    ("Work - Solstice Aerospace", ("solstice", "aerospace", "hydrogen", "aircraft", "aviation", "airline", "fuel cell", "faa")),
+    ("Work - Consulting", ("consulting", "anthimeros", "fractional", "client", "proposal", "firesale", "focus")),
+    ("Vermouth/Cartographer", ("vermouth", "cartographer", "tincture", "botanical", "extraction", "wormwood", "gentian", "filtering")),
+    ("Personal Projects", ("ira", "penumbra", "book tracking", "raspberry pi", "traffic light", "tinsel tag")),
+    ("Style & Fashion", ("outfit", "styling", "shirt", "jeans", "sock", "shoes", "wardrobe", "wes anderson", "chore jacket")),
+    ("Health & Fitness", ("fitness", "cycling", "bike", "ride", "oura", "readiness", "recovery", "hrv", "supplement", "vitamin", "nutrition", "sleep")),
+    ("Food & Dining", ("restaurant", "dinner", "lunch", "coffee", "cocktail", "bar", "sushi", "austin", "brunch", "solo dining", "date night")),
+    ("Parenting & Family", ("toddler", "kid", "child", "parenting", "family", "school", "teacher", "swim", "separation anxiety", "sleep training", "meltdown")),
+    ("Technical/Coding", ("code", "python", "script", "api", "css", "ghost", "dataview", "obsidian", "google sheets", "spreadsheet", "formula")),
+    ("Finance & Business", ("salary", "budget", "investment", "tax", "insurance", "equity", "fundraising", "pitch", "investor")),
+    ("Philosophy & Learning", ("philosophy", "explain", "etymology", "meaning", "what is", "why", "history")),
+    ("Travel", ("trip", "paris", "france", "denver", "colorado", "san francisco")),
+)
 
-def analyze_conversations(convos):
-    """Generate comprehensive conversation statistics"""
+# Flattened (keyword, topic index) pairs in priority order, plus topic names
+# indexed the same way with "Other" last for names that match nothing
+KEYWORD_TABLE = tuple((keyword, index) for index, (_, keywords) in enumerate(TOPIC_KEYWORDS) for keyword in keywords)
+TOPIC_NAMES = tuple(topic for topic, _ in TOPIC_KEYWORDS) + ("Other",)
+OTHER_INDEX = len(TOPIC_KEYWORDS)
+
+PHILOSOPHICAL_KEYWORDS = ("philosophy", "meaning", "why", "existence", "purpose", "ethics")
+GROWTH_KEYWORDS = ("coaching", "therapy", "journal", "reflection", "goals", "habits")
+
+# Category flags carried by each keyword in the shared automaton
+PHILOSOPHICAL = 1
+GROWTH = 2
+
+
+def build_keyword_automaton():
+    """
+    Build one Aho-Corasick automaton over the topic, philosophical and growth
+    keywords. Each keyword maps to (index of its first topic, category flags);
+    keywords that only flag a category get OTHER_INDEX.
+    """
+    tags = {}
+    for keyword, index in KEYWORD_TABLE:
+        tags.setdefault(keyword, [index, 0])
+    for flag, keywords in ((PHILOSOPHICAL, PHILOSOPHICAL_KEYWORDS), (GROWTH, GROWTH_KEYWORDS)):
+        for keyword in keywords:
+            tags.setdefault(keyword, [OTHER_INDEX, 0])[1] |= flag
+
+    automaton = ahocorasick.Automaton()
+    for keyword, (index, flags) in tags.items():
+        automaton.add_word(keyword, (index, flags))
+    automaton.make_automaton()
+    return automaton
+
+
+KEYWORD_AUTOMATON = build_keyword_automaton() if ahocorasick else None
+
+
+def classify_name(name_lc):
+    """
+    Classify a lowercased conversation name in one scan. Returns (topic,
+    philosophical, personal_growth); the first topic in TOPIC_KEYWORDS with
+    a matching keyword wins, "Other" if none match.
+    """
+    if KEYWORD_AUTOMATON is not None:
+        topic_index, flags = OTHER_INDEX, 0
+        for _, (index, flag) in KEYWORD_AUTOMATON.iter(name_lc):
+            if index < topic_index:
+                topic_index = index
+            flags |= flag
+        return TOPIC_NAMES[topic_index], bool(flags & PHILOSOPHICAL), bool(flags & GROWTH)
+
+    topic_index = OTHER_INDEX
+    for keyword, index in KEYWORD_TABLE:
+        if keyword in name_lc:
+            topic_index = index
+            break
+    return (TOPIC_NAMES[topic_index],
+            any(kw in name_lc for kw in PHILOSOPHICAL_KEYWORDS),
+            any(kw in name_lc for kw in GROWTH_KEYWORDS))
+
+
+def analyze_chunk(convos, position=0):
+    """
+    Accumulate raw statistics, topics and notable conversations for a batch
+    of conversations in a single pass. position is the index of the batch's
+    first conversation in the export, which keeps ties in the longest
+    conversations list in export order. Returns a partial result for
+    merge_partials / finalize_analysis.
+    """
     stats = {
-        "total_conversations": len(convos),
+        "total_conversations": 0,
         "total_messages": 0,
         "human_messages": 0,
         "assistant_messages": 0,
         "human_words": 0,
         "assistant_words": 0,
-        "conversations_by_month": Counter(),
-        "messages_by_hour": Counter(),
-        "messages_by_weekday": Counter(),
+        "empty_conversations": 0,
+        "conversations_by_month": defaultdict(int),
         "conversation_lengths": [],
         "longest_conversations": [],
-        "conversation_names": [],
     }
-
-    weekday_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+    # Running totals live in locals inside the loop and are written back once
+    total_messages = human_messages = assistant_messages = human_words = assistant_words = 0
+    by_month = stats["conversations_by_month"]
+    lengths_append = stats["conversation_lengths"].append
+    # Fixed-size histograms indexed by Central hour (0-23) and weekday (0=Monday)
+    hour_hist = [0] * 24
+    weekday_hist = [0] * 7
+    # Slots in the order they were first hit, so peak ties go to the first
+    # one seen, as they did with Counter.most_common()
+    hour_order = []
+    weekday_order = []
+    # Min-heap of the 20 longest conversations seen so far
+    longest = []
+    topic_counts = defaultdict(int)
+    categorized_convos = defaultdict(list)
+    interesting = {
+        "philosophical": [],
+        "quick_questions": [],
+        "deep_dives": [],
+        "personal_growth": [],
+    }
 
     for convo in convos:
-        # Track conversation name
-        name = convo.get("name", "Untitled")
+        stats["total_conversations"] += 1
+
+        # A missing name keeps each output's own default: "" in the keyword
+        # scan and interesting.json, the raw value in categorized_conversations
+        # and "Untitled" in the longest conversations
+        name = convo.get("name", "")
+        name_lc = name.lower() if name else ""
         created = convo.get("created_at", "")[:10]
-        stats["conversation_names"].append({"name": name, "date": created})
 
-        # Count by month
+        # Count by month - the YYYY-MM string is the key written to JSON
         if created:
-            month = created[:7]
-            stats["conversations_by_month"][month] += 1
+            by_month[created[:7]] += 1
 
-        messages = convo.get("chat_messages", [])
+        messages = convo.get("chat_messages", ())
         msg_count = len(messages)
-        stats["total_messages"] += msg_count
-        stats["conversation_lengths"].append(msg_count)
+        total_messages += msg_count
+        lengths_append(msg_count)
+
+        # Categorize by topic and flag notable themes in one keyword scan
+        topic, philosophical, personal_growth = classify_name(name_lc)
+        topic_counts[topic] += 1
+        categorized_convos[topic].append({"name": convo.get("name"), "date": created})
+
+        # Quick questions (2 messages = question + answer)
+        if msg_count == 2:
+            interesting["quick_questions"].append(name)
+
+        # Deep dives (30+ messages)
+        if msg_count >= 30:
+            interesting["deep_dives"].append({
+                "name": name,
+                "messages": msg_count
+            })
 
-        human_words_in_convo = 0
-        assistant_words_in_convo = 0
+        # Philosophical conversations
+        if philosophical:
+            interesting["philosophical"].append(name)
+
+        # Personal growth
+        if personal_growth:
+            interesting["personal_growth"].append(name)
+
+        # Nothing below applies to conversations without messages
+        if not msg_count:
+            stats["empty_conversations"] += 1
+            continue
+
+        human_msgs_in_convo = assistant_msgs_in_convo = 0
+        human_words_in_convo = assistant_words_in_convo = 0
 
         for msg in messages:
-            sender = msg.get("sender", "")
-            text = msg.get("text", "")
-            created_at = msg.get("created_at", "")
+            get = msg.get
+            sender = get("sender", "")
+            text = get("text", "")
+            created_at = get("created_at", "")
 
-            word_count = count_words(text)
+            # str.split() runs entirely in C and is the fastest exact word
+            # count; a \S+ regex is ~6x slower and counting separators
+            # miscounts whitespace runs
+            word_count = len(text.split()) if text else 0
 
             if sender == "human":
-                stats["human_messages"] += 1
-                stats["human_words"] += word_count
+                human_msgs_in_convo += 1
                 human_words_in_convo += word_count
             elif sender == "assistant":
-                stats["assistant_messages"] += 1
-                stats["assistant_words"] += word_count
+                assistant_msgs_in_convo += 1
                 assistant_words_in_convo += word_count
 
-            # Track by hour and weekday
-            hour = extract_hour(created_at)
-            if hour is not None:
-                stats["messages_by_hour"][hour] += 1
-
-            weekday = extract_weekday(created_at)
-            if weekday is not None:
-                stats["messages_by_weekday"][weekday_names[weekday]] += 1
-
-        # Track longest conversations
-        stats["longest_conversations"].append({
-            "name": name,
-            "messages": msg_count,
-            "human_words": human_words_in_convo,
-            "assistant_words": assistant_words_in_convo,
-            "date": created
-        })
+            # Track by hour and weekday - timestamps are fixed-width ISO 8601
+            # (YYYY-MM-DDTHH:MM:SS...Z), so slice instead of building a datetime.
+            # YYYY-MM-DD?HH is required, with a real date and an hour of 00-23;
+            # anything else is skipped, including date-only values, which
+            # fromisoformat used to count as midnight
+            if not (isinstance(created_at, str) and len(created_at) >= 13
+                    and created_at[4] == "-" and created_at[7] == "-"):
+                continue
+            hour = created_at[11:13]
+            weekday = utc_weekday(created_at[:10])
+            if not (hour.isascii() and hour.isdigit() and int(hour) < 24) or weekday is None:
+                continue
+            # Convert from UTC to Central Time (UTC-6, ignoring DST for simplicity);
+            # before 6am UTC it's still the previous day in Central
+            utc_hour = int(hour)
+            central_hour = (utc_hour - 6) % 24
+            central_day = (weekday - (utc_hour < 6)) % 7
+            if not hour_hist[central_hour]:
+                hour_order.append(central_hour)
+            if not weekday_hist[central_day]:
+                weekday_order.append(central_day)
+            hour_hist[central_hour] += 1
+            weekday_hist[central_day] += 1
+
+        human_messages += human_msgs_in_convo
+        assistant_messages += assistant_msgs_in_convo
+        human_words += human_words_in_convo
+        assistant_words += assistant_words_in_convo
+
+        # Track longest conversations; the negated position keeps earlier
+        # conversations ahead of later ones with the same message count
+        entry = (msg_count, -(position + stats["total_conversations"]), convo.get("name", "Untitled"),
+                 human_words_in_convo, assistant_words_in_convo, created)
+        if len(longest) < 20:
+            heappush(longest, entry)
+        elif entry > longest[0]:
+            heapreplace(longest, entry)
+
+    stats["total_messages"] = total_messages
+    stats["human_messages"] = human_messages
+    stats["assistant_messages"] = assistant_messages
+    stats["human_words"] = human_words
+    stats["assistant_words"] = assistant_words
+
+    return {
+        "stats": stats,
+        "hour_hist": hour_hist,
+        "weekday_hist": weekday_hist,
+        "hour_order": hour_order,
+        "weekday_order": weekday_order,
+        "longest": longest,
+        "topic_counts": topic_counts,
+        "categorized_convos": categorized_convos,
+        "interesting": interesting,
+    }
+
+
+def analyze_chunk_job(job):
+    """Pool worker entry point: job is a (position, conversations) pair"""
+    return analyze_chunk(job[1], job[0])
+
+
+def merge_partials(partials):
+    """Combine analyze_chunk results, given in export order, into one"""
+    merged = None
+    for part in partials:
+        if merged is None:
+            merged = part
+            continue
+        stats, other = merged["stats"], part["stats"]
+        for key in ("total_conversations", "total_messages", "human_messages",
+                    "assistant_messages", "human_words", "assistant_words",
+                    "empty_conversations"):
+            stats[key] += other[key]
+        for month, count in other["conversations_by_month"].items():
+            stats["conversations_by_month"][month] += count
+        stats["conversation_lengths"].extend(other["conversation_lengths"])
+
+        merged["hour_hist"] = [a + b for a, b in zip(merged["hour_hist"], part["hour_hist"])]
+        merged["weekday_hist"] = [a + b for a, b in zip(merged["weekday_hist"], part["weekday_hist"])]
+        merged["hour_order"] += [h for h in part["hour_order"] if h not in merged["hour_order"]]
+        merged["weekday_order"] += [d for d in part["weekday_order"] if d not in merged["weekday_order"]]
+        merged["longest"] = nlargest(20, merged["longest"] + part["longest"])
+        for topic, count in part["topic_counts"].items():
+            merged["topic_counts"][topic] += count
+        for topic, convos in part["categorized_convos"].items():
+            merged["categorized_convos"][topic].extend(convos)
+        for key, convos in part["interesting"].items():
+            merged["interesting"][key].extend(convos)
+    return merged if merged is not None else analyze_chunk(())
+
+
+def finalize_analysis(partial):
+    """Turn an analyze_chunk/merge_partials result into (stats, topics, interesting)"""
+    stats = partial["stats"]
+    hour_hist = partial["hour_hist"]
+    weekday_hist = partial["weekday_hist"]
+    hour_order = partial["hour_order"]
+    weekday_order = partial["weekday_order"]
+    longest = partial["longest"]
+    topic_counts = partial["topic_counts"]
+    categorized_convos = partial["categorized_convos"]
+    interesting = partial["interesting"]
 
     # Sort longest conversations
-    stats["longest_conversations"].sort(key=lambda x: x["messages"], reverse=True)
-    stats["longest_conversations"] = stats["longest_conversations"][:20]
+    stats["longest_conversations"] = [
+        {"name": n, "messages": m, "human_words": hw, "assistant_words": aw, "date": d}
+        for m, _, n, hw, aw, d in sorted(longest, reverse=True)
+    ]
 
     # Calculate averages
     if stats["total_conversations"] > 0:
@@ -159,59 +503,56 @@ def analyze_conversations(convos):
         stats["avg_human_words_per_convo"] = stats["human_words"] / stats["total_conversations"]
         stats["avg_assistant_words_per_convo"] = stats["assistant_words"] / stats["total_conversations"]
 
-    # Find peak hours and days
-    if stats["messages_by_hour"]:
-        stats["peak_hour"] = stats["messages_by_hour"].most_common(1)[0]
-    if stats["messages_by_weekday"]:
-        stats["peak_weekday"] = stats["messages_by_weekday"].most_common(1)[0]
-
-    return stats
-
-
-def extract_topics(convos):
-    """Extract and categorize topics from conversation names"""
-    topic_keywords = {
-        "Work - Duckbill": ["duckbill", "gmv", "influencer", "tagline", "billboard", "marketing copy", "pricing strategy"],
-        "Work - Solstice Aerospace": ["solstice", "aerospace", "hydrogen", "aircraft", "aviation", "airline", "fuel cell", "faa"],
-        "Work - Consulting": ["consulting", "anthimeros", "fractional", "client", "proposal", "firesale", "focus"],
-        "Vermouth/Cartographer": ["vermouth", "cartographer", "tincture", "botanical", "extraction", "wormwood", "gentian", "filtering"],
-        "Personal Projects": ["ira", "penumbra", "book tracking", "raspberry pi", "traffic light", "tinsel tag"],
-        "Style & Fashion": ["outfit", "styling", "shirt", "jeans", "sock", "shoes", "wardrobe", "wes anderson", "chore jacket"],
-        "Health & Fitness": ["fitness", "cycling", "bike", "ride", "oura", "readiness", "recovery", "hrv", "supplement", "vitamin", "nutrition", "sleep"],
-        "Food & Dining": ["restaurant", "dinner", "lunch", "coffee", "cocktail", "bar", "sushi", "austin", "brunch", "solo dining", "date night"],
-        "Parenting & Family": ["toddler", "kid", "child", "parenting", "family", "school", "teacher", "swim", "separation anxiety", "sleep training", "meltdown"],
-        "Technical/Coding": ["code", "python", "script", "api", "css", "ghost", "dataview", "obsidian", "google sheets", "spreadsheet", "formula"],
-        "Finance & Business": ["salary", "budget", "investment", "tax", "insurance", "equity", "fundraising", "pitch", "investor"],
-        "Philosophy & Learning": ["philosophy", "explain", "etymology", "meaning", "what is", "why", "history"],
-        "Travel": ["trip", "paris", "france", "denver", "colorado", "san francisco"],
+    # Months are stored in calendar order, so readers never need to sort them
+    stats["conversations_by_month"] = dict(sorted(stats["conversations_by_month"].items()))
+    stats["messages_by_hour"] = {hour: n for hour, n in enumerate(hour_hist) if n}
+    stats["messages_by_weekday"] = {WEEKDAY_NAMES[day]: n for day, n in enumerate(weekday_hist) if n}
+
+    # Find peak hours and days; max() keeps the first of equal counts, and
+    # scanning in first-seen order breaks ties as most_common(1) did
+    if hour_order:
+        hour = max(hour_order, key=hour_hist.__getitem__)
+        stats["peak_hour"] = (hour, hour_hist[hour])
+    if weekday_order:
+        day = max(weekday_order, key=weekday_hist.__getitem__)
+        stats["peak_weekday"] = (WEEKDAY_NAMES[day], weekday_hist[day])
+
+    topics = {
+        # Same ordering as Counter.most_common(): stable sort, ties keep first-seen order
+        "topic_counts": dict(sorted(topic_counts.items(), key=itemgetter(1), reverse=True)),
+        "categorized_conversations": {k: v[:10] for k, v in categorized_convos.items()}  # Top 10 per category
     }
 
-    topic_counts = Counter()
-    categorized_convos = defaultdict(list)
+    return stats, topics, interesting
+
 
+def chunked(convos, size):
+    """Yield (position, list of up to size conversations) batches"""
+    batch = []
+    position = 0
     for convo in convos:
-        name = convo.get("name", "").lower()
-        created = convo.get("created_at", "")[:10]
-        matched = False
-
-        for topic, keywords in topic_keywords.items():
-            for keyword in keywords:
-                if keyword in name:
-                    topic_counts[topic] += 1
-                    categorized_convos[topic].append({"name": convo.get("name"), "date": created})
-                    matched = True
-                    break
-            if matched:
-                break
-
-        if not matched:
-            topic_counts["Other"] += 1
-            categorized_convos["Other"].append({"name": convo.get("name"), "date": created})
+        batch.append(convo)
+        if len(batch) == size:
+            yield position, batch
+            position += size
+            batch = []
+    if batch:
+        yield position, batch
 
-    return {
-        "topic_counts": dict(topic_counts.most_common()),
-        "categorized_conversations": {k: v[:10] for k, v in categorized_convos.items()}  # Top 10 per category
-    }
+
+def analyze_all(convos, jobs=1, chunk_size=500):
+    """
+    Generate conversation statistics, topics and notable conversations in a
+    single pass, so conversations can be streamed straight from the loader.
+    With jobs > 1, batches of chunk_size conversations are analyzed in worker
+    processes and merged in export order. Returns (stats, topics, interesting).
+    """
+    if jobs <= 1:
+        return finalize_analysis(analyze_chunk(convos))
+
+    with Pool(jobs) as pool:
+        partials = pool.imap(analyze_chunk_job, chunked(convos, chunk_size))
+        return finalize_analysis(merge_partials(partials))
 
 
 def analyze_projects(projects):
@@ -232,16 +573,16 @@ def extract_time_patterns(stats):
     """Analyze time-based patterns for interesting insights"""
     patterns = {}
 
-    # Determine actual peak period - handle both int and string keys
-    hours = stats.get("messages_by_hour", {})
-
-    def get_hour(h):
-        return hours.get(h, 0) + hours.get(str(h), 0)
+    # Determine actual peak period - keys are ints here but strings when
+    # reloaded from JSON, so fold them into a 24-slot histogram first
+    by_hour = [0] * 24
+    for h, n in stats.get("messages_by_hour", {}).items():
+        by_hour[int(h)] += n
 
-    morning = sum(get_hour(h) for h in range(5, 12))      # 5am-11am
-    afternoon = sum(get_hour(h) for h in range(12, 18))   # 12pm-5pm
-    evening = sum(get_hour(h) for h in range(18, 22))     # 6pm-9pm
-    late_night = sum(get_hour(h) for h in [22, 23, 0, 1, 2, 3, 4])  # 10pm-4am
+    morning = sum(by_hour[5:12])                          # 5am-11am
+    afternoon = sum(by_hour[12:18])                       # 12pm-5pm
+    evening = sum(by_hour[18:22])                         # 6pm-9pm
+    late_night = sum(by_hour[22:]) + sum(by_hour[:5])     # 10pm-4am
 
     periods = {
         "Morning Person (5am-noon)": morning,
@@ -266,86 +607,12 @@ def extract_time_patterns(stats):
     return patterns
 
 
-def find_interesting_conversations(convos):
-    """Find notable/interesting conversation patterns"""
-    interesting = {
-        "philosophical": [],
-        "quick_questions": [],
-        "deep_dives": [],
-        "personal_growth": [],
-    }
-
-    keywords_philosophical = ["philosophy", "meaning", "why", "existence", "purpose", "ethics"]
-    keywords_growth = ["coaching", "therapy", "journal", "reflection", "goals", "habits"]
-
-    for convo in convos:
-        name = convo.get("name", "").lower()
-        msg_count = len(convo.get("chat_messages", []))
-
-        # Quick questions (2 messages = question + answer)
-        if msg_count == 2:
-            interesting["quick_questions"].append(convo.get("name", ""))
-
-        # Deep dives (30+ messages)
-        if msg_count >= 30:
-            interesting["deep_dives"].append({
-                "name": convo.get("name", ""),
-                "messages": msg_count
-            })
-
-        # Philosophical conversations
-        for kw in keywords_philosophical:
-            if kw in name:
-                interesting["philosophical"].append(convo.get("name", ""))
-                break
-
-        # Personal growth
-        for kw in keywords_growth:
-            if kw in name:
-                interesting["personal_growth"].append(convo.get("name", ""))
-                break
-
-    return interesting
-
-
-def calculate_carbon_footprint(stats):
+def carbon_core(total_pairs):
     """
-    AGGRESSIVE carbon footprint estimate for power users with extended thinking.
-
-    This estimate intentionally errs HIGH to avoid underestimating impact.
-
-    === ENERGY ===
-    Claude 3.7 Sonnet ET benchmarked at 17 Wh for long prompts (arxiv 2505.09598).
-    Power users doing substantive work: assume ALL queries are long/complex.
-    Using 20 Wh base (above benchmark, accounting for heavy reasoning budgets).
-
-    PUE: 1.3 (conservative for AI workloads; typical hyperscaler is 1.2)
-
-    === CARBON ===
-    Grid intensity: 0.45 kg CO2/kWh (above US average, accounts for peaker plants)
-    Hardware embodied: 1.5x operational (GPU fab, server manufacturing, logistics)
-
-    Training amortization: Reasoning models generate 4-10x more internal tokens.
-    Base 6g/query × 4x multiplier = 24g CO2/query for extended thinking.
-
-    === WATER ===
-    Direct cooling: 2.5 L/kWh (upper range for evaporative cooling)
-    Indirect (power generation): 7.6 L/kWh (thermoelectric plant water)
-    Total: 10 L/kWh combined
-
-    === OFFSET ===
-    $20/ton (quality premium over typical $15 voluntary market rate)
-
-    NOTE: Claude.ai web usage only. API and Claude Code would ADD to this.
-
-    Sources:
-    - arxiv.org/abs/2505.09598 (Claude ET: 17 Wh long prompts)
-    - EESI.org (data center water: 1-9 L/kWh direct)
-    - IEEE Spectrum (7.6 L/kWh indirect from power generation)
-    - Nous Research (reasoning models 4-10x token overhead)
+    Unrounded footprint figures for a number of message exchanges.
+    Pure scalar math, so it can be applied per month or per topic cheaply;
+    see calculate_carbon_footprint for the methodology and sources.
     """
-    total_pairs = min(stats["human_messages"], stats["assistant_messages"])
-
     # === ENERGY ===
     # Extended thinking benchmark: 17 Wh for long prompts
     # Power user: all queries substantive, pushing reasoning budgets
@@ -397,6 +664,52 @@ def calculate_carbon_footprint(stats):
     flight_miles = total_co2_kg / 0.25  # 0.25 kg CO2/passenger-mile
     showers = water_liters / 65  # 65L per shower
 
+    return (operational_kwh, electricity_co2_kg, operational_co2_kg, training_co2_kg,
+            total_co2_kg, total_co2_tons, offset_cost, water_liters,
+            car_miles, flight_miles, showers)
+
+
+def calculate_carbon_footprint(stats):
+    """
+    AGGRESSIVE carbon footprint estimate for power users with extended thinking.
+
+    This estimate intentionally errs HIGH to avoid underestimating impact.
+
+    === ENERGY ===
+    Claude 3.7 Sonnet ET benchmarked at 17 Wh for long prompts (arxiv 2505.09598).
+    Power users doing substantive work: assume ALL queries are long/complex.
+    Using 20 Wh base (above benchmark, accounting for heavy reasoning budgets).
+
+    PUE: 1.3 (conservative for AI workloads; typical hyperscaler is 1.2)
+
+    === CARBON ===
+    Grid intensity: 0.45 kg CO2/kWh (above US average, accounts for peaker plants)
+    Hardware embodied: 1.5x operational (GPU fab, server manufacturing, logistics)
+
+    Training amortization: Reasoning models generate 4-10x more internal tokens.
+    Base 6g/query × 4x multiplier = 24g CO2/query for extended thinking.
+
+    === WATER ===
+    Direct cooling: 2.5 L/kWh (upper range for evaporative cooling)
+    Indirect (power generation): 7.6 L/kWh (thermoelectric plant water)
+    Total: 10 L/kWh combined
+
+    === OFFSET ===
+    $20/ton (quality premium over typical $15 voluntary market rate)
+
+    NOTE: Claude.ai web usage only. API and Claude Code would ADD to this.
+
+    Sources:
+    - arxiv.org/abs/2505.09598 (Claude ET: 17 Wh long prompts)
+    - EESI.org (data center water: 1-9 L/kWh direct)
+    - IEEE Spectrum (7.6 L/kWh indirect from power generation)
+    - Nous Research (reasoning models 4-10x token overhead)
+    """
+    total_pairs = min(stats["human_messages"], stats["assistant_messages"])
+    (operational_kwh, electricity_co2_kg, operational_co2_kg, training_co2_kg,
+     total_co2_kg, total_co2_tons, offset_cost, water_liters,
+     car_miles, flight_miles, showers) = carbon_core(total_pairs)
+
     return {
         "operational_kwh": round(operational_kwh, 1),
         "electricity_co2_kg": round(electricity_co2_kg, 1),
@@ -453,9 +766,11 @@ def generate_wrapped_stats(stats, topics, projects):
     # Conversation length distribution
     lengths = stats.get("conversation_lengths", [])
     if lengths:
-        quick_chats = sum(1 for l in lengths if l <= 4)
-        medium_convos = sum(1 for l in lengths if 4 < l <= 20)
-        deep_dives = sum(1 for l in lengths if l > 20)
+        # Counter tallies the lengths in C; bucket the few distinct values after
+        buckets = [0, 0, 0]  # quick (≤4), medium (5-20), deep (20+)
+        for length, count in Counter(lengths).items():
+            buckets[(length > 4) + (length > 20)] += count
+        quick_chats, medium_convos, deep_dives = buckets
         wrapped["personality_insights"]["quick_chats"] = quick_chats
         wrapped["personality_insights"]["medium_conversations"] = medium_convos
         wrapped["personality_insights"]["deep_dives"] = deep_dives
@@ -476,21 +791,22 @@ def generate_wrapped_stats(stats, topics, projects):
     wrapped["time_patterns"] = extract_time_patterns(stats)
 
     # Top topics (excluding "Other")
-    filtered_topics = [(k, v) for k, v in topics["topic_counts"].items() if k != "Other"]
-    wrapped["top_topics"] = filtered_topics[:7]
+    # topic_counts is already ranked, so stop after the first seven
+    filtered_topics = ((k, v) for k, v in topics["topic_counts"].items() if k != "Other")
+    wrapped["top_topics"] = list(islice(filtered_topics, 7))
     wrapped["other_topics_count"] = topics["topic_counts"].get("Other", 0)
 
     # Busiest month
     if stats["conversations_by_month"]:
-        busiest = stats["conversations_by_month"].most_common(1)[0]
+        busiest = max(stats["conversations_by_month"].items(), key=itemgetter(1))
         wrapped["streaks_and_records"]["busiest_month"] = busiest[0]
         wrapped["streaks_and_records"]["busiest_month_convos"] = busiest[1]
 
         # Growth trend
-        sorted_months = sorted(stats["conversations_by_month"].items())
-        if len(sorted_months) >= 2:
-            first_half = sum(v for k, v in sorted_months[:len(sorted_months)//2])
-            second_half = sum(v for k, v in sorted_months[len(sorted_months)//2:])
+        month_counts = list(stats["conversations_by_month"].values())
+        if len(month_counts) >= 2:
+            first_half = sum(month_counts[:len(month_counts)//2])
+            second_half = sum(month_counts) - first_half
             if second_half > first_half:
                 wrapped["streaks_and_records"]["usage_trend"] = "📈 Increasing over time"
             else:
@@ -510,20 +826,27 @@ def generate_wrapped_stats(stats, topics, projects):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Analyze exported Claude conversations")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="worker processes for the conversation pass (default: 1)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="re-parse conversations instead of using the cached parse in analysis/")
+    args = parser.parse_args()
+
     print("🎁 Claude 2025 Wrapped - Analyzing your conversations...\n")
 
     # Load data - filter to 2025 only
     print("📂 Loading data (2025 only)...")
-    convos = load_conversations(year_filter=2025)
+    if args.no_cache:
+        convos = load_conversations(year_filter=2025)
+    else:
+        convos = load_conversations_cached(year_filter=2025)
     projects = load_projects()
     memories = load_memories()
 
     # Analyze
-    print("📊 Analyzing conversations...")
-    stats = analyze_conversations(convos)
-
-    print("🏷️  Extracting topics...")
-    topics = extract_topics(convos)
+    print("📊 Analyzing conversations and topics...")
+    stats, topics, interesting = analyze_all(convos, jobs=args.jobs)
 
     print("📁 Analyzing projects...")
     project_stats = analyze_projects(projects)
@@ -534,90 +857,89 @@ def main():
     # Save results
     print("\n💾 Saving analysis results...")
 
-    with open(ANALYSIS_DIR / "conversation_stats.json", "w") as f:
-        # Convert Counter objects to dicts for JSON serialization
-        stats_serializable = stats.copy()
-        stats_serializable["conversations_by_month"] = dict(stats["conversations_by_month"])
-        stats_serializable["messages_by_hour"] = dict(stats["messages_by_hour"])
-        stats_serializable["messages_by_weekday"] = dict(stats["messages_by_weekday"])
-        json.dump(stats_serializable, f, indent=2)
-
-    with open(ANALYSIS_DIR / "topics.json", "w") as f:
-        json.dump(topics, f, indent=2)
-
-    with open(ANALYSIS_DIR / "projects.json", "w") as f:
-        json.dump(project_stats, f, indent=2)
-
-    with open(ANALYSIS_DIR / "wrapped.json", "w") as f:
-        json.dump(wrapped, f, indent=2)
-
-    # Print summary
-    print("\n" + "=" * 60)
-    print("🎊 YOUR CLAUDE 2025 WRAPPED 🎊")
-    print("=" * 60)
-
-    print(f"\n📈 THE BIG NUMBERS")
-    print(f"   Conversations: {wrapped['headline_stats']['total_conversations']}")
-    print(f"   Messages exchanged: {wrapped['headline_stats']['total_messages']}")
-    print(f"   Words you wrote: {wrapped['headline_stats']['total_words_you_wrote']:,}")
-    print(f"   Words Claude wrote: {wrapped['headline_stats']['total_words_claude_wrote']:,}")
-    print(f"   Projects used: {wrapped['headline_stats']['projects_used']}")
-
-    print(f"\n📚 THAT'S EQUIVALENT TO:")
-    print(f"   📖 {wrapped['fun_comparisons']['equivalent_novels']} novels worth of text")
-    print(f"   📄 {wrapped['fun_comparisons']['pages_of_text']:,} pages of writing")
-    print(f"   🎧 {wrapped['fun_comparisons']['hours_of_audiobook']} hours of audiobook")
-    print(f"   📕 {wrapped['fun_comparisons']['the_great_gatsby_equivalents']}x The Great Gatsby")
-
-    print(f"\n🎯 YOUR TOP TOPICS:")
+    # The files are independent, so their writes overlap on a thread pool;
+    # list() drains the results so any write error is raised here.
+    outputs = {
+        "conversation_stats.json": stats,
+        "topics.json": topics,
+        "interesting.json": interesting,
+        "projects.json": project_stats,
+        "wrapped.json": wrapped,
+    }
+    with ThreadPoolExecutor(max_workers=len(outputs)) as pool:
+        list(pool.map(save_json, (ANALYSIS_DIR / name for name in outputs), outputs.values()))
+
+    # Print summary - collect the lines and write them to stdout in one go
+    lines = []
+    emit = lines.append
+    emit("\n" + "=" * 60)
+    emit("🎊 YOUR CLAUDE 2025 WRAPPED 🎊")
+    emit("=" * 60)
+
+    emit(f"\n📈 THE BIG NUMBERS")
+    emit(f"   Conversations: {wrapped['headline_stats']['total_conversations']}")
+    emit(f"   Messages exchanged: {wrapped['headline_stats']['total_messages']}")
+    emit(f"   Words you wrote: {wrapped['headline_stats']['total_words_you_wrote']:,}")
+    emit(f"   Words Claude wrote: {wrapped['headline_stats']['total_words_claude_wrote']:,}")
+    emit(f"   Projects used: {wrapped['headline_stats']['projects_used']}")
+
+    emit(f"\n📚 THAT'S EQUIVALENT TO:")
+    emit(f"   📖 {wrapped['fun_comparisons']['equivalent_novels']} novels worth of text")
+    emit(f"   📄 {wrapped['fun_comparisons']['pages_of_text']:,} pages of writing")
+    emit(f"   🎧 {wrapped['fun_comparisons']['hours_of_audiobook']} hours of audiobook")
+    emit(f"   📕 {wrapped['fun_comparisons']['the_great_gatsby_equivalents']}x The Great Gatsby")
+
+    emit(f"\n🎯 YOUR TOP TOPICS:")
     for i, (topic, count) in enumerate(wrapped['top_topics'], 1):
-        print(f"   {i}. {topic} ({count} conversations)")
+        emit(f"   {i}. {topic} ({count} conversations)")
     if wrapped.get("other_topics_count", 0) > 0:
-        print(f"   + {wrapped['other_topics_count']} miscellaneous conversations")
+        emit(f"   + {wrapped['other_topics_count']} miscellaneous conversations")
 
-    print(f"\n💬 CONVERSATION STYLE:")
+    emit(f"\n💬 CONVERSATION STYLE:")
     insights = wrapped.get("personality_insights", {})
-    print(f"   Communication style: {insights.get('your_communication_style', 'N/A')}")
-    print(f"   Quick Q&As (≤4 msgs): {insights.get('quick_chats', 0)}")
-    print(f"   Medium conversations: {insights.get('medium_conversations', 0)}")
-    print(f"   Deep dives (20+ msgs): {insights.get('deep_dives', 0)}")
+    emit(f"   Communication style: {insights.get('your_communication_style', 'N/A')}")
+    emit(f"   Quick Q&As (≤4 msgs): {insights.get('quick_chats', 0)}")
+    emit(f"   Medium conversations: {insights.get('medium_conversations', 0)}")
+    emit(f"   Deep dives (20+ msgs): {insights.get('deep_dives', 0)}")
 
-    print(f"\n⏰ WHEN YOU CHAT:")
+    emit(f"\n⏰ WHEN YOU CHAT:")
     if "favorite_hour" in wrapped["peak_usage"]:
-        print(f"   Peak hour: {wrapped['peak_usage']['favorite_hour']} ({wrapped['peak_usage']['favorite_hour_messages']} messages)")
+        emit(f"   Peak hour: {wrapped['peak_usage']['favorite_hour']} ({wrapped['peak_usage']['favorite_hour_messages']} messages)")
     if "favorite_day" in wrapped["peak_usage"]:
-        print(f"   Peak day: {wrapped['peak_usage']['favorite_day']} ({wrapped['peak_usage']['favorite_day_messages']} messages)")
+        emit(f"   Peak day: {wrapped['peak_usage']['favorite_day']} ({wrapped['peak_usage']['favorite_day_messages']} messages)")
     time_patterns = wrapped.get("time_patterns", {})
     if "chronotype" in time_patterns:
-        print(f"   Your chronotype: {time_patterns['chronotype']}")
+        emit(f"   Your chronotype: {time_patterns['chronotype']}")
     if "weekend_percentage" in time_patterns:
-        print(f"   Weekend usage: {time_patterns['weekend_percentage']}%")
+        emit(f"   Weekend usage: {time_patterns['weekend_percentage']}%")
 
-    print(f"\n🏆 RECORDS & TRENDS:")
+    emit(f"\n🏆 RECORDS & TRENDS:")
     records = wrapped.get("streaks_and_records", {})
     if "busiest_month" in records:
-        print(f"   Busiest month: {records['busiest_month']} ({records['busiest_month_convos']} conversations)")
+        emit(f"   Busiest month: {records['busiest_month']} ({records['busiest_month_convos']} conversations)")
     if "usage_trend" in records:
-        print(f"   Usage trend: {records['usage_trend']}")
+        emit(f"   Usage trend: {records['usage_trend']}")
     if "longest_conversation" in records:
         name = records['longest_conversation'][:45]
-        print(f"   Longest conversation: \"{name}...\"")
-        print(f"      ({records['longest_conversation_messages']} messages)")
+        emit(f"   Longest conversation: \"{name}...\"")
+        emit(f"      ({records['longest_conversation_messages']} messages)")
 
-    print(f"\n🤖 VERBOSITY INSIGHT:")
+    emit(f"\n🤖 VERBOSITY INSIGHT:")
     if "claude_verbosity_ratio" in insights:
         ratio = insights["claude_verbosity_ratio"]
-        print(f"   For every word you wrote, Claude wrote {ratio} words back")
+        emit(f"   For every word you wrote, Claude wrote {ratio} words back")
         if ratio > 6:
-            print(f"   You're efficient - you get a lot of value per word!")
+            emit(f"   You're efficient - you get a lot of value per word!")
         elif ratio > 4:
-            print(f"   You have great back-and-forth conversations")
+            emit(f"   You have great back-and-forth conversations")
         else:
-            print(f"   You're a detailed communicator")
+            emit(f"   You're a detailed communicator")
+
+    emit("\n" + "=" * 60)
+    emit(f"📁 Full analysis saved to: {ANALYSIS_DIR}")
+    emit("=" * 60)
 
-    print("\n" + "=" * 60)
-    print(f"📁 Full analysis saved to: {ANALYSIS_DIR}")
-    print("=" * 60)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -3,121 +3,145 @@
 Generate a visual HTML Wrapped report
 """
 
+import base64
+import gzip
 import json
+import math
+import re
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from html import escape
 from pathlib import Path
+from string import Template
 
 ANALYSIS_DIR = Path(__file__).parent / "analysis"
 OUTPUT_DIR = Path(__file__).parent / "output"
+ASSETS_DIR = Path(__file__).parent / "assets"
+FONTS_DIR = ASSETS_DIR / "fonts"
+
+# Typed views of the wrapped.json sections the report shows. Defaults stand in
+# for missing values; keys the report doesn't use are dropped on load.
+@dataclass(slots=True)
+class Headline:
+    total_conversations: int = 0
+    total_messages: int = 0
+    total_words_you_wrote: int = 0
+    total_words_claude_wrote: int = 0
+    projects_used: int = 0
+    total_words_exchanged: int = 0
+
+@dataclass(slots=True)
+class Comparisons:
+    equivalent_novels: float = 0
+    pages_of_text: int = 0
+    hours_of_audiobook: float = 0
+    the_great_gatsby_equivalents: float = 0
+
+@dataclass(slots=True)
+class Insights:
+    your_communication_style: str = "N/A"
+    quick_chats: int = 0
+    deep_dives: int = 0
+    claude_verbosity_ratio: float = 0
+
+@dataclass(slots=True)
+class PeakUsage:
+    favorite_hour: str = "N/A"
+    favorite_day: str = "N/A"
+
+@dataclass(slots=True)
+class TimePatterns:
+    chronotype: str = "N/A"
+    weekend_percentage: float = 0
+
+@dataclass(slots=True)
+class Records:
+    top_5_longest: list = field(default_factory=list)
+    busiest_month: str = "N/A"
+    busiest_month_convos: int = 0
+    usage_trend: str = "N/A"
+
+@dataclass(slots=True)
+class Carbon:
+    message_pairs: int = 0
+    total_co2_kg: float = 0
+    operational_co2_kg: float = 0
+    training_co2_kg: float = 0
+    car_miles_equivalent: float = 0
+    water_liters: float = 0
+    showers_equivalent: float = 0
+    operational_kwh: float = 0
+    offset_cost_usd: float = 0
+
+# wrapped.json key -> section class, in the order generate_html() unpacks them
+WRAPPED_SECTIONS = {
+    "headline_stats": Headline,
+    "fun_comparisons": Comparisons,
+    "personality_insights": Insights,
+    "peak_usage": PeakUsage,
+    "time_patterns": TimePatterns,
+    "streaks_and_records": Records,
+    "carbon_footprint": Carbon,
+}
+
+def load_section(cls, data):
+    return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
+
+@lru_cache(maxsize=4)
+def load_analysis(path, mtime_ns):
+    # mtime_ns only keys the cache, so a rewritten file is parsed again
+    with open(path, "rb") as f:
+        return json.load(f)
 
 def load_wrapped():
-    with open(ANALYSIS_DIR / "wrapped.json", "r") as f:
-        return json.load(f)
+    path = ANALYSIS_DIR / "wrapped.json"
+    return load_analysis(path, path.stat().st_mtime_ns)
 
 def load_stats():
-    with open(ANALYSIS_DIR / "conversation_stats.json", "r") as f:
-        return json.load(f)
-
-def generate_html():
-    wrapped = load_wrapped()
-    stats = load_stats()
-
-    # Prepare data for charts
-    months_data = stats.get("conversations_by_month", {})
-    sorted_months = sorted(months_data.items())
-    month_abbrevs = {
-        "01": "Jan", "02": "Feb", "03": "Mar", "04": "Apr",
-        "05": "May", "06": "Jun", "07": "Jul", "08": "Aug",
-        "09": "Sep", "10": "Oct", "11": "Nov", "12": "Dec"
-    }
-    months_labels = [month_abbrevs.get(m[0].split("-")[1], m[0]) for m in sorted_months]
-    months_values = [m[1] for m in sorted_months]
-
-    hours_data = stats.get("messages_by_hour", {})
-    def format_hour(h):
-        if h == 0:
-            return "12am"
-        elif h < 12:
-            return f"{h}am"
-        elif h == 12:
-            return "12pm"
-        else:
-            return f"{h-12}pm"
-    hours_labels = [format_hour(h) for h in range(24)]
-    hours_values = [hours_data.get(str(h), 0) for h in range(24)]
+    path = ANALYSIS_DIR / "conversation_stats.json"
+    return load_analysis(path, path.stat().st_mtime_ns)
 
-    weekday_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-    weekday_data = stats.get("messages_by_weekday", {})
-    weekday_values = [weekday_data.get(d, 0) for d in weekday_order]
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};])\s*", r"\1", css).strip()
 
-    topics = wrapped.get("top_topics", [])
-    topic_labels = [t[0] for t in topics]
-    topic_values = [t[1] for t in topics]
+def minify_html(html):
+    # No <pre> or <textarea> in the report, so leading indentation never matters
+    return re.sub(r"\n\s+", "\n", re.sub(r"<!--.*?-->", "", html, flags=re.S))
 
-    headline = wrapped.get("headline_stats", {})
-    comparisons = wrapped.get("fun_comparisons", {})
-    insights = wrapped.get("personality_insights", {})
-    peak = wrapped.get("peak_usage", {})
-    time_patterns = wrapped.get("time_patterns", {})
-    records = wrapped.get("streaks_and_records", {})
-    carbon = wrapped.get("carbon_footprint", {})
-
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Claude 2025 Wrapped</title>
-
-    <!-- Favicon -->
-    <link rel="icon" type="image/svg+xml" href="assets/favicon.svg">
-
-    <!-- Open Graph / Social Sharing -->
-    <meta property="og:type" content="website">
-    <meta property="og:title" content="Claude 2025 Wrapped">
-    <meta property="og:description" content="A year in AI conversations: 501 conversations, 748k words exchanged, 140 days active.">
-    <meta property="og:image" content="https://prjcts.alxprst.co/claude-2025-wrapped/assets/og-image.png">
-    <meta property="og:url" content="https://prjcts.alxprst.co/claude-2025-wrapped/">
-    <meta name="twitter:card" content="summary_large_image">
-    <meta name="twitter:title" content="Claude 2025 Wrapped">
-    <meta name="twitter:description" content="A year in AI conversations: 501 conversations, 748k words exchanged, 140 days active.">
-    <meta name="twitter:image" content="https://prjcts.alxprst.co/claude-2025-wrapped/assets/og-image.png">
-
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Work+Sans:wght@300;400;500;600&display=swap" rel="stylesheet">
-    <style>
-        /* Cartridge font - hosted on alexpriest.com */
-        @font-face {{
+# Page stylesheet, kept apart from HTML_SOURCE and passed in whole as $css
+CSS_SOURCE = """        /* Cartridge font - hosted on alexpriest.com */
+        @font-face {
             font-family: "Cartridge";
             src: url("https://alexpriest.com/assets/fonts/Cartridge-Light.woff2") format("woff2");
             font-weight: 300;
             font-style: normal;
             font-display: swap;
-        }}
-        @font-face {{
+        }
+        @font-face {
             font-family: "Cartridge";
             src: url("https://alexpriest.com/assets/fonts/Cartridge-Regular.woff2") format("woff2");
             font-weight: 400;
             font-style: normal;
             font-display: swap;
-        }}
-        @font-face {{
+        }
+        @font-face {
             font-family: "Cartridge";
             src: url("https://alexpriest.com/assets/fonts/Cartridge-Semibold.woff2") format("woff2");
             font-weight: 600;
             font-style: normal;
             font-display: swap;
-        }}
+        }
 
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
         /* Light mode (default) */
-        :root {{
+        :root {
             --bg-primary: #fffcf0;
             --bg-secondary: #f5f2e6;
             --bg-card: #ffffff;
@@ -134,11 +158,11 @@ def generate_html():
             --green-border: #22c55e;
             --green-text: #16a34a;
             --green-text-dark: #15803d;
-        }}
+        }
 
         /* Dark mode */
-        @media (prefers-color-scheme: dark) {{
-            :root {{
+        @media (prefers-color-scheme: dark) {
+            :root {
                 --bg-primary: #100f0f;
                 --bg-secondary: #1a1918;
                 --bg-card: #242220;
@@ -155,10 +179,10 @@ def generate_html():
                 --green-border: #22c55e;
                 --green-text: #4ade80;
                 --green-text-dark: #86efac;
-            }}
-        }}
+            }
+        }
 
-        body {{
+        body {
             font-family: 'Work Sans', -apple-system, BlinkMacSystemFont, sans-serif;
             font-weight: 300;
             background: var(--bg-primary);
@@ -166,141 +190,181 @@ def generate_html():
             min-height: 100vh;
             padding: 2rem;
             line-height: 1.6;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1000px;
             margin: 0 auto;
-        }}
+        }
 
-        header {{
+        header {
             text-align: center;
             padding: 3rem 0;
-        }}
+        }
 
-        h1, h2, h3 {{
+        h1, h2, h3 {
             font-family: "Cartridge", 'Work Sans', -apple-system, BlinkMacSystemFont, sans-serif;
-        }}
+        }
 
-        h1 {{
+        h1 {
             font-size: 3rem;
             font-weight: 600;
             color: var(--accent);
             margin-bottom: 0.5rem;
             letter-spacing: -0.02em;
             font-feature-settings: "ss02" on;
-        }}
+        }
 
-        .subtitle {{
+        .subtitle {
             font-size: 1.1rem;
             color: var(--text-secondary);
             font-weight: 300;
-        }}
+        }
 
-        .section {{
+        .section {
             background: var(--bg-secondary);
             border-radius: 12px;
             padding: 2rem;
             margin-bottom: 1.5rem;
             border: 1px solid var(--border);
-        }}
+        }
 
-        .section h2 {{
+        .section h2 {
             font-size: 1.25rem;
             font-weight: 500;
             margin-bottom: 1.5rem;
             color: var(--accent);
-        }}
+        }
 
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
             gap: 1rem;
-        }}
+        }
 
-        .stat-card {{
+        .stat-card {
             background: var(--bg-card);
             border-radius: 8px;
             padding: 1.25rem;
             text-align: center;
             border: 1px solid var(--border);
-        }}
+        }
 
-        .stat-value {{
+        .stat-value {
             font-size: 2.25rem;
             font-weight: 600;
             color: var(--accent);
-        }}
+        }
 
-        .stat-label {{
+        .stat-label {
             font-size: 0.85rem;
             color: var(--text-secondary);
             margin-top: 0.25rem;
             font-weight: 400;
-        }}
+        }
 
-        .comparison-grid {{
+        .comparison-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(160px, 1fr));
             gap: 1rem;
-        }}
+        }
 
-        .comparison-card {{
+        .comparison-card {
             background: var(--bg-card);
             border-radius: 8px;
             padding: 1.25rem;
             text-align: center;
             border: 1px solid var(--border);
-        }}
+        }
 
-        .comparison-icon {{
+        .comparison-icon {
             font-size: 1.75rem;
             margin-bottom: 0.5rem;
-        }}
+        }
 
-        .comparison-value {{
+        .comparison-value {
             font-size: 1.5rem;
             font-weight: 600;
             color: var(--accent-light);
-        }}
+        }
 
-        .comparison-label {{
+        .comparison-label {
             font-size: 0.8rem;
             color: var(--text-secondary);
             margin-top: 0.25rem;
-        }}
+        }
 
-        .chart-container {{
+        .chart-container {
             height: 280px;
             margin: 1rem 0;
-        }}
+        }
 
-        .chart-row {{
+        .chart-svg {
+            display: block;
+            width: 100%;
+            height: 100%;
+        }
+
+        .chart-svg .grid {
+            stroke: var(--chart-grid);
+        }
+
+        .chart-svg .axis-label {
+            fill: var(--text-secondary);
+            font-size: 10px;
+        }
+
+        .chart-svg .bar {
+            fill: var(--accent);
+            fill-opacity: 0.85;
+        }
+
+        .chart-svg .area {
+            fill: var(--accent-glow);
+        }
+
+        .chart-svg .line {
+            fill: none;
+            stroke: var(--accent);
+            stroke-width: 2;
+        }
+
+        /* Points stay hidden until hovered; they're there for the tooltips */
+        .chart-svg .point {
+            fill: var(--accent);
+            fill-opacity: 0;
+        }
+
+        .chart-svg .point:hover {
+            fill-opacity: 1;
+        }
+
+        .chart-row {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(380px, 1fr));
             gap: 1.5rem;
-        }}
+        }
 
-        .chart-section h3 {{
+        .chart-section h3 {
             font-size: 0.9rem;
             color: var(--text-secondary);
             margin-bottom: 0.75rem;
             font-weight: 400;
-        }}
+        }
 
-        .topic-list {{
+        .topic-list {
             display: flex;
             flex-direction: column;
             gap: 0.6rem;
-        }}
+        }
 
-        .topic-item {{
+        .topic-item {
             display: flex;
             align-items: center;
             gap: 0.75rem;
-        }}
+        }
 
-        .topic-rank {{
+        .topic-rank {
             width: 28px;
             height: 28px;
             border-radius: 50%;
@@ -311,9 +375,9 @@ def generate_html():
             font-weight: 600;
             font-size: 0.85rem;
             color: #fff;
-        }}
+        }
 
-        .topic-bar {{
+        .topic-bar {
             flex: 1;
             height: 36px;
             background: var(--bg-card);
@@ -321,73 +385,73 @@ def generate_html():
             overflow: hidden;
             position: relative;
             border: 1px solid var(--border);
-        }}
+        }
 
-        .topic-fill {{
+        .topic-fill {
             height: 100%;
             background: linear-gradient(90deg, var(--accent), var(--accent-light));
             border-radius: 5px;
             display: flex;
             align-items: center;
             padding-left: 0.75rem;
-        }}
+        }
 
-        .topic-name {{
+        .topic-name {
             font-size: 0.85rem;
             white-space: nowrap;
             font-weight: 500;
             color: #fff;
-        }}
+        }
 
-        .topic-count {{
+        .topic-count {
             position: absolute;
             right: 0.75rem;
             top: 50%;
             transform: translateY(-50%);
             font-size: 0.85rem;
             color: var(--text-muted);
-        }}
+        }
 
-        .insight-grid {{
+        .insight-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
             gap: 1rem;
-        }}
+        }
 
-        .insight-card {{
+        .insight-card {
             background: var(--bg-card);
             border-radius: 8px;
             padding: 1.25rem;
             border-left: 3px solid var(--accent);
-        }}
+        }
 
-        .insight-title {{
+        .insight-title {
             font-size: 0.8rem;
             color: var(--text-muted);
             margin-bottom: 0.25rem;
             font-weight: 400;
             text-transform: uppercase;
             letter-spacing: 0.05em;
-        }}
+        }
 
-        .insight-value {{
+        .insight-value {
             font-size: 1.1rem;
             font-weight: 500;
             color: var(--text-primary);
-        }}
+        }
 
-        .longest-convos {{
+        .longest-convos {
             margin-top: 1.5rem;
-        }}
+        }
 
-        .longest-convos h3 {{
+        .longest-convos h3 {
             font-size: 0.9rem;
             color: var(--text-secondary);
             margin-bottom: 0.75rem;
             font-weight: 400;
-        }}
+        }
 
-        .convo-item {{
+        .convo-item {
             padding: 0.875rem 1rem;
             background: var(--bg-card);
             border-radius: 6px;
@@ -396,161 +460,242 @@ def generate_html():
             justify-content: space-between;
             align-items: center;
             border: 1px solid var(--border);
-        }}
+        }
 
-        .convo-name {{
+        .convo-name {
             font-size: 0.9rem;
             max-width: 75%;
             overflow: hidden;
             text-overflow: ellipsis;
             white-space: nowrap;
             font-weight: 400;
-        }}
+        }
 
-        .convo-msgs {{
+        .convo-msgs {
             color: var(--accent);
             font-weight: 500;
             font-size: 0.9rem;
-        }}
+        }
 
-        .deep-insight {{
+        .deep-insight {
             padding: 1.5rem;
             background: var(--bg-card);
             border-radius: 8px;
             margin-bottom: 1rem;
             border: 1px solid var(--border);
-        }}
+        }
 
-        .deep-insight h3 {{
+        .deep-insight h3 {
             font-size: 1.1rem;
             font-weight: 500;
             color: var(--accent);
             margin-bottom: 0.75rem;
-        }}
+        }
 
-        .deep-insight p {{
+        .deep-insight p {
             font-size: 0.95rem;
             line-height: 1.7;
             color: var(--text-secondary);
-        }}
+        }
 
-        .deep-insight .highlight {{
+        .deep-insight .highlight {
             color: var(--text-primary);
             font-weight: 500;
-        }}
+        }
 
-        .traits-section {{
+        .traits-section {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(320px, 1fr));
             gap: 2rem;
             margin-top: 1.5rem;
-        }}
+        }
 
-        .traits-column h3 {{
+        .traits-column h3 {
             font-size: 1rem;
             font-weight: 500;
             color: var(--accent);
             margin-bottom: 1rem;
             padding-bottom: 0.5rem;
             border-bottom: 1px solid var(--border);
-        }}
+        }
 
-        .traits-list {{
+        .traits-list {
             list-style: none;
             padding: 0;
             margin: 0;
-        }}
+        }
 
-        .traits-list li {{
+        .traits-list li {
             margin-bottom: 1.25rem;
             padding-left: 0;
-        }}
+        }
 
-        .traits-list li strong {{
+        .traits-list li strong {
             display: block;
             font-size: 0.95rem;
             font-weight: 500;
             color: var(--text-primary);
             margin-bottom: 0.35rem;
-        }}
+        }
 
-        .traits-list li span {{
+        .traits-list li span {
             display: block;
             font-size: 0.9rem;
             line-height: 1.6;
             color: var(--text-secondary);
-        }}
+        }
 
-        .traits-list.growth li strong {{
+        .traits-list.growth li strong {
             color: var(--text-primary);
-        }}
+        }
 
-        .month-narrative {{
+        .month-narrative {
             padding: 1.5rem;
             background: var(--bg-card);
             border-radius: 8px;
             margin-bottom: 1rem;
             border: 1px solid var(--border);
-        }}
+        }
 
-        .month-header {{
+        .month-header {
             display: flex;
             justify-content: space-between;
             align-items: baseline;
             margin-bottom: 0.75rem;
             flex-wrap: wrap;
             gap: 0.5rem;
-        }}
+        }
 
-        .month-name {{
+        .month-name {
             font-size: 1.1rem;
             font-weight: 500;
             color: var(--accent);
-        }}
+        }
 
-        .month-theme {{
+        .month-theme {
             font-size: 0.85rem;
             color: var(--text-muted);
             font-style: italic;
-        }}
+        }
 
-        .month-narrative p {{
+        .month-narrative p {
             font-size: 0.95rem;
             line-height: 1.7;
             color: var(--text-secondary);
             margin: 0;
-        }}
+        }
 
-        .month-narrative p strong {{
+        .month-narrative p strong {
             color: var(--text-primary);
             font-weight: 500;
-        }}
+        }
 
-        footer {{
+        footer {
             text-align: center;
             padding: 2.5rem 1rem;
             color: var(--text-muted);
             font-size: 0.85rem;
-        }}
+        }
 
-        footer p {{
+        footer p {
             margin-bottom: 0.25rem;
-        }}
+        }
 
-        @media (max-width: 768px) {{
-            body {{
+        @media (max-width: 768px) {
+            body {
                 padding: 1rem;
-            }}
-            h1 {{
+            }
+            h1 {
                 font-size: 2rem;
-            }}
-            .chart-row {{
+            }
+            .chart-row {
                 grid-template-columns: 1fr;
-            }}
-            .section {{
+            }
+            .section {
                 padding: 1.5rem;
-            }}
-        }}
+            }
+        }"""
+
+def data_uri(path, mime):
+    return f"data:{mime};base64,{base64.b64encode(path.read_bytes()).decode('ascii')}"
+
+def inline_local_fonts(css):
+    # Cartridge woff2 files found in assets/fonts/ are embedded instead of fetched
+    def embed(match):
+        font = FONTS_DIR / match.group(1)
+        return f'url("{data_uri(font, "font/woff2")}")' if font.exists() else match.group(0)
+    return re.sub(r'url\("https://alexpriest\.com/assets/fonts/([\w-]+\.woff2)"\)', embed, css)
+
+# Comments and indentation only help when editing, so strip them once at import
+CSS = minify_css(inline_local_fonts(CSS_SOURCE))
+
+# Embedded so the page needs no assets/ folder next to it (output/ has none)
+FAVICON_PATH = ASSETS_DIR / "favicon.svg"
+FAVICON = data_uri(FAVICON_PATH, "image/svg+xml") if FAVICON_PATH.exists() else "assets/favicon.svg"
+
+# Month-by-month narrative as (months, theme, paragraph HTML); each tuple
+# becomes one .month-narrative block
+MONTHS = [
+    ("January - February", "Aviation Focus",
+     "The year started with <strong>Solstice Aerospace</strong> front and center - 79 aviation-related mentions in February. Pitch deck work, cofounder search, hydrogen aircraft feasibility research. You were heads-down on one thing."),
+    ("March", "Busy",
+     "55 conversations - your busiest early month. Aviation work continued (recruiting engineers, accident analysis, Pacific logistics), but life stuff appeared too: a child's stomach symptoms needed sorting out. The dual-track of work and parenting showed up clearly this month."),
+    ("April", "New Threads",
+     "Aviation still central, but other things started appearing. First vermouth conversations. A traffic light alert device concept. Lost jewelry, insurance claims. Less singular focus, more variety creeping in."),
+    ("May - June", "Personal Brand Work",
+     "Focus shifted to positioning yourself: superpower statements, bio drafts, website CSS. A lot of Ghost theme work. You were building the infrastructure for fractional consulting - how you'd present yourself to potential clients."),
+    ("July - August", "Quiet Transition",
+     "Only 24 conversations across two months - noticeably slower. You were splitting time more aggressively between Claude and ChatGPT during this period. The conversations that happened were about Duckbill marketing, consulting landing pages, new client work. A pivot was underway, just not a loud one."),
+    ("September", "The ChatGPT Experiment",
+     "<strong>1 conversation</strong>. You switched to ChatGPT almost exclusively for the month - an experiment in the other direction. The lone Claude conversation that month was brief. This is the gap in the chart."),
+    ("October", "Back to Claude, Full Throttle",
+     "<strong>119 conversations</strong> - you came back from the ChatGPT experiment and went all-in on Claude. Duckbill work dominated (74 mentions), but you were also into fitness tracking, food logging apps, parenting stuff, vermouth experiments. A lot of plates spinning simultaneously."),
+    ("November", "Peak Activity",
+     "<strong>140 conversations</strong> - your highest month. Vermouth/Cartographer became a real focus (76 mentions). Conversations with the Four Sigmatic founder. Restaurant recommendations. Parenting. Style advice. Kid was sick. You were doing a lot of different things at once."),
+    ("December", "Winding Down",
+     "54 conversations - slower pace. Technical projects, partnership thinking, this Wrapped analysis. More reflection than execution. Setting up for next year rather than sprinting to finish this one."),
+]
+
+# Static prose, so rendered once here rather than on every generate_html()
+MONTH_NARRATIVES_HTML = minify_html("".join([f'''
+            <div class="month-narrative">
+                <div class="month-header">
+                    <span class="month-name">{name}</span>
+                    <span class="month-theme">{theme}</span>
+                </div>
+                <p>{body}</p>
+            </div>
+            ''' for name, theme, body in MONTHS]))
+
+# Page template. $name placeholders are filled in by generate_html(); CSS
+# braces need no escaping, and a literal dollar sign is written as $$.
+HTML_SOURCE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Claude 2025 Wrapped</title>
+
+    <!-- Favicon -->
+    <link rel="icon" type="image/svg+xml" href="$favicon">
+
+    <!-- Open Graph / Social Sharing -->
+    <meta property="og:type" content="website">
+    <meta property="og:title" content="Claude 2025 Wrapped">
+    <meta property="og:description" content="A year in AI conversations: 501 conversations, 748k words exchanged, 140 days active.">
+    <meta property="og:image" content="https://prjcts.alxprst.co/claude-2025-wrapped/assets/og-image.png">
+    <meta property="og:url" content="https://prjcts.alxprst.co/claude-2025-wrapped/">
+    <meta name="twitter:card" content="summary_large_image">
+    <meta name="twitter:title" content="Claude 2025 Wrapped">
+    <meta name="twitter:description" content="A year in AI conversations: 501 conversations, 748k words exchanged, 140 days active.">
+    <meta name="twitter:image" content="https://prjcts.alxprst.co/claude-2025-wrapped/assets/og-image.png">
+
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link rel="preload" href="https://fonts.googleapis.com/css2?family=Work+Sans:wght@300;400;500;600&display=swap" as="style">
+    <link href="https://fonts.googleapis.com/css2?family=Work+Sans:wght@300;400;500;600&display=swap" rel="stylesheet">
+    <style>
+$css
     </style>
 </head>
 <body>
@@ -564,19 +709,19 @@ def generate_html():
             <h2>The Big Numbers</h2>
             <div class="stats-grid">
                 <div class="stat-card">
-                    <div class="stat-value">{headline.get('total_conversations', 0)}</div>
+                    <div class="stat-value">$total_conversations</div>
                     <div class="stat-label">Conversations</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-value">{headline.get('total_messages', 0):,}</div>
+                    <div class="stat-value">$total_messages</div>
                     <div class="stat-label">Messages Exchanged</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-value">{headline.get('total_words_you_wrote', 0):,}</div>
+                    <div class="stat-value">$total_words_you_wrote</div>
                     <div class="stat-label">Words You Wrote</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-value">{headline.get('total_words_claude_wrote', 0):,}</div>
+                    <div class="stat-value">$total_words_claude_wrote</div>
                     <div class="stat-label">Words Claude Wrote</div>
                 </div>
                 <div class="stat-card">
@@ -592,7 +737,7 @@ def generate_html():
                     <div class="stat-label">Deep Dives (20+ msgs)</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-value">{headline.get('projects_used', 0)}</div>
+                    <div class="stat-value">$projects_used</div>
                     <div class="stat-label">Projects Used</div>
                 </div>
             </div>
@@ -600,26 +745,26 @@ def generate_html():
 
         <section class="section">
             <h2>Together We Wrote...</h2>
-            <p style="color: var(--text-secondary); font-size: 0.9rem; margin-bottom: 1.25rem;">{headline.get('total_words_exchanged', 0):,} total words exchanged</p>
+            <p style="color: var(--text-secondary); font-size: 0.9rem; margin-bottom: 1.25rem;">$total_words_exchanged total words exchanged</p>
             <div class="comparison-grid">
                 <div class="comparison-card">
                     <div class="comparison-icon">📖</div>
-                    <div class="comparison-value">{comparisons.get('equivalent_novels', 0)}</div>
+                    <div class="comparison-value">$equivalent_novels</div>
                     <div class="comparison-label">Novels Worth of Text</div>
                 </div>
                 <div class="comparison-card">
                     <div class="comparison-icon">📄</div>
-                    <div class="comparison-value">{comparisons.get('pages_of_text', 0):,}</div>
+                    <div class="comparison-value">$pages_of_text</div>
                     <div class="comparison-label">Pages of Writing</div>
                 </div>
                 <div class="comparison-card">
                     <div class="comparison-icon">🎧</div>
-                    <div class="comparison-value">{comparisons.get('hours_of_audiobook', 0)}</div>
+                    <div class="comparison-value">$hours_of_audiobook</div>
                     <div class="comparison-label">Hours of Audiobook</div>
                 </div>
                 <div class="comparison-card">
                     <div class="comparison-icon">📕</div>
-                    <div class="comparison-value">{comparisons.get('the_great_gatsby_equivalents', 0)}x</div>
+                    <div class="comparison-value">${gatsby_equivalents}x</div>
                     <div class="comparison-label">The Great Gatsby</div>
                 </div>
             </div>
@@ -628,17 +773,7 @@ def generate_html():
         <section class="section">
             <h2>Your Top Topics</h2>
             <div class="topic-list">
-                {"".join(f'''
-                <div class="topic-item">
-                    <div class="topic-rank">{i+1}</div>
-                    <div class="topic-bar">
-                        <div class="topic-fill" style="width: {min(100, t[1] / max(topic_values) * 100)}%">
-                            <span class="topic-name">{t[0]}</span>
-                        </div>
-                        <span class="topic-count">{t[1]} convos</span>
-                    </div>
-                </div>
-                ''' for i, t in enumerate(topics))}
+                $topic_items
             </div>
         </section>
 
@@ -649,13 +784,13 @@ def generate_html():
                 <div>
                     <h3 style="font-size: 1rem; color: #94a3b8; margin-bottom: 0.5rem;">Conversations by Month</h3>
                     <div class="chart-container">
-                        <canvas id="monthsChart"></canvas>
+                        $months_chart
                     </div>
                 </div>
                 <div>
                     <h3 style="font-size: 1rem; color: #94a3b8; margin-bottom: 0.5rem;">Messages by Hour</h3>
                     <div class="chart-container">
-                        <canvas id="hoursChart"></canvas>
+                        $hours_chart
                     </div>
                 </div>
             </div>
@@ -666,35 +801,35 @@ def generate_html():
             <div class="insight-grid">
                 <div class="insight-card">
                     <div class="insight-title">Your Chronotype</div>
-                    <div class="insight-value">{time_patterns.get('chronotype', 'N/A')}</div>
+                    <div class="insight-value">$chronotype</div>
                 </div>
                 <div class="insight-card">
                     <div class="insight-title">Peak Hour</div>
-                    <div class="insight-value">{peak.get('favorite_hour', 'N/A')}</div>
+                    <div class="insight-value">$favorite_hour</div>
                 </div>
                 <div class="insight-card">
                     <div class="insight-title">Peak Day</div>
-                    <div class="insight-value">{peak.get('favorite_day', 'N/A')}</div>
+                    <div class="insight-value">$favorite_day</div>
                 </div>
                 <div class="insight-card">
                     <div class="insight-title">Communication Style</div>
-                    <div class="insight-value">{insights.get('your_communication_style', 'N/A')}</div>
+                    <div class="insight-value">$communication_style</div>
                 </div>
                 <div class="insight-card">
                     <div class="insight-title">Quick Q&As</div>
-                    <div class="insight-value">{insights.get('quick_chats', 0)}</div>
+                    <div class="insight-value">$quick_chats</div>
                 </div>
                 <div class="insight-card">
                     <div class="insight-title">Deep Dives (20+ msgs)</div>
-                    <div class="insight-value">{insights.get('deep_dives', 0)}</div>
+                    <div class="insight-value">$deep_dives</div>
                 </div>
                 <div class="insight-card">
                     <div class="insight-title">Claude Verbosity Ratio</div>
-                    <div class="insight-value">{insights.get('claude_verbosity_ratio', 0)}x</div>
+                    <div class="insight-value">${verbosity_ratio}x</div>
                 </div>
                 <div class="insight-card">
                     <div class="insight-title">Weekend Usage</div>
-                    <div class="insight-value">{time_patterns.get('weekend_percentage', 0)}%</div>
+                    <div class="insight-value">$weekend_percentage%</div>
                 </div>
             </div>
         </section>
@@ -704,22 +839,17 @@ def generate_html():
             <div class="insight-grid">
                 <div class="insight-card">
                     <div class="insight-title">Busiest Month</div>
-                    <div class="insight-value">{records.get('busiest_month', 'N/A')} ({records.get('busiest_month_convos', 0)} convos)</div>
+                    <div class="insight-value">$busiest_month ($busiest_month_convos convos)</div>
                 </div>
                 <div class="insight-card">
                     <div class="insight-title">Usage Trend</div>
-                    <div class="insight-value">{records.get('usage_trend', 'N/A')}</div>
+                    <div class="insight-value">$usage_trend</div>
                 </div>
             </div>
 
             <div class="longest-convos">
                 <h3 style="font-size: 1rem; color: #94a3b8; margin-bottom: 1rem;">Your Longest Conversations</h3>
-                {"".join(f'''
-                <div class="convo-item">
-                    <span class="convo-name">{c['name'][:60]}...</span>
-                    <span class="convo-msgs">{c['messages']} msgs</span>
-                </div>
-                ''' for c in records.get('top_5_longest', [])[:5])}
+                $longest_convo_items
             </div>
         </section>
 
@@ -728,24 +858,24 @@ def generate_html():
             <p style="color: var(--text-secondary); font-size: 0.9rem; margin-bottom: 1.25rem;">Claude.ai web usage only — API and Claude Code usage would add to this total</p>
             <div class="deep-insight">
                 <h3>Your Environmental Impact</h3>
-                <p>Your {carbon.get('message_pairs', 0):,} message exchanges produced an estimated <span class="highlight">{carbon.get('total_co2_kg', 0)} kg of CO2</span>. That's {carbon.get('operational_co2_kg', 0)} kg from inference + hardware embodied carbon, plus {carbon.get('training_co2_kg', 0)} kg from amortized model training. Equivalent to driving <span class="highlight">{int(carbon.get('car_miles_equivalent', 0)):,} miles</span>. Data center and power plant cooling used <span class="highlight">{int(carbon.get('water_liters', 0)):,} liters of water</span> ({carbon.get('showers_equivalent', 0)} showers).</p>
+                <p>Your $message_pairs message exchanges produced an estimated <span class="highlight">$total_co2_kg kg of CO2</span>. That's $operational_co2_kg kg from inference + hardware embodied carbon, plus $training_co2_kg kg from amortized model training. Equivalent to driving <span class="highlight">$car_miles miles</span>. Data center and power plant cooling used <span class="highlight">$water_liters liters of water</span> ($showers_equivalent showers).</p>
             </div>
 
             <div class="stats-grid" style="margin-top: 1rem;">
                 <div class="stat-card">
-                    <div class="stat-value">{carbon.get('total_co2_kg', 0)}</div>
+                    <div class="stat-value">$total_co2_kg</div>
                     <div class="stat-label">kg CO2</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-value">{carbon.get('operational_kwh', 0)}</div>
+                    <div class="stat-value">$operational_kwh</div>
                     <div class="stat-label">kWh Energy</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-value">{int(carbon.get('water_liters', 0)):,}</div>
+                    <div class="stat-value">$water_liters</div>
                     <div class="stat-label">Liters Water</div>
                 </div>
                 <div class="stat-card">
-                    <div class="stat-value">{int(carbon.get('car_miles_equivalent', 0)):,}</div>
+                    <div class="stat-value">$car_miles</div>
                     <div class="stat-label">Car Miles Equiv.</div>
                 </div>
             </div>
@@ -753,28 +883,28 @@ def generate_html():
             <div class="insight-grid" style="margin-top: 1rem;">
                 <div class="insight-card">
                     <div class="insight-title">Inference + Hardware</div>
-                    <div class="insight-value">{carbon.get('operational_co2_kg', 0)} kg CO2</div>
+                    <div class="insight-value">$operational_co2_kg kg CO2</div>
                 </div>
                 <div class="insight-card">
                     <div class="insight-title">Training (Amortized)</div>
-                    <div class="insight-value">{carbon.get('training_co2_kg', 0)} kg CO2</div>
+                    <div class="insight-value">$training_co2_kg kg CO2</div>
                 </div>
             </div>
 
             <div class="stats-grid" style="margin-top: 1.5rem;">
                 <div class="stat-card" style="background: var(--green-bg); border: 2px solid var(--green-border); grid-column: span 2;">
-                    <div class="stat-value" style="color: var(--green-text); font-size: 2.75rem;">${carbon.get('offset_cost_usd', 0):.2f}</div>
+                    <div class="stat-value" style="color: var(--green-text); font-size: 2.75rem;">$$$offset_cost</div>
                     <div class="stat-label" style="color: var(--green-text-dark); font-weight: 500;">Estimated Offset Cost</div>
                 </div>
             </div>
 
             <div class="deep-insight" style="margin-top: 1.5rem; background: var(--green-bg-alt); border-left: 3px solid var(--green-border);">
                 <h3 style="color: var(--green-text);">How to Offset</h3>
-                <p>To neutralize your Claude.ai carbon footprint, donate <span class="highlight" style="color: var(--green-text);">${carbon.get('offset_cost_usd', 0):.2f}</span> to a quality offset provider: <a href="https://www.goldstandard.org/" target="_blank" style="color: var(--accent);">Gold Standard</a>, <a href="https://www.southpole.com/" target="_blank" style="color: var(--accent);">South Pole</a>, or <a href="https://www.cooleffect.org/" target="_blank" style="color: var(--accent);">Cool Effect</a>.</p>
+                <p>To neutralize your Claude.ai carbon footprint, donate <span class="highlight" style="color: var(--green-text);">$$$offset_cost</span> to a quality offset provider: <a href="https://www.goldstandard.org/" target="_blank" style="color: var(--accent);">Gold Standard</a>, <a href="https://www.southpole.com/" target="_blank" style="color: var(--accent);">South Pole</a>, or <a href="https://www.cooleffect.org/" target="_blank" style="color: var(--accent);">Cool Effect</a>.</p>
             </div>
 
             <p style="font-size: 0.75rem; color: var(--text-muted); margin-top: 1rem; line-height: 1.5;">
-                <em>Aggressive methodology for power users: 20 Wh/query (above 17 Wh extended thinking benchmark), ×1.3 PUE, ×1.5 hardware embodied, 0.45 kg CO2/kWh grid, training at 24g/query (6g base × 4 for reasoning overhead), water at 10 L/kWh (direct + indirect), $20/ton offset. Sources: <a href="https://arxiv.org/abs/2505.09598" target="_blank" style="color: var(--text-muted);">arxiv.org/abs/2505.09598</a>, <a href="https://www.eesi.org/articles/view/data-centers-and-water-consumption" target="_blank" style="color: var(--text-muted);">EESI</a>, <a href="https://spectrum.ieee.org/ai-water-usage" target="_blank" style="color: var(--text-muted);">IEEE Spectrum</a></em>
+                <em>Aggressive methodology for power users: 20 Wh/query (above 17 Wh extended thinking benchmark), ×1.3 PUE, ×1.5 hardware embodied, 0.45 kg CO2/kWh grid, training at 24g/query (6g base × 4 for reasoning overhead), water at 10 L/kWh (direct + indirect), $$20/ton offset. Sources: <a href="https://arxiv.org/abs/2505.09598" target="_blank" style="color: var(--text-muted);">arxiv.org/abs/2505.09598</a>, <a href="https://www.eesi.org/articles/view/data-centers-and-water-consumption" target="_blank" style="color: var(--text-muted);">EESI</a>, <a href="https://spectrum.ieee.org/ai-water-usage" target="_blank" style="color: var(--text-muted);">IEEE Spectrum</a></em>
             </p>
         </section>
 
@@ -851,77 +981,7 @@ def generate_html():
         <section class="section">
             <h2>Your Year, Month by Month</h2>
 
-            <div class="month-narrative">
-                <div class="month-header">
-                    <span class="month-name">January - February</span>
-                    <span class="month-theme">Aviation Focus</span>
-                </div>
-                <p>The year started with <strong>Solstice Aerospace</strong> front and center - 79 aviation-related mentions in February. Pitch deck work, cofounder search, hydrogen aircraft feasibility research. You were heads-down on one thing.</p>
-            </div>
-
-            <div class="month-narrative">
-                <div class="month-header">
-                    <span class="month-name">March</span>
-                    <span class="month-theme">Busy</span>
-                </div>
-                <p>55 conversations - your busiest early month. Aviation work continued (recruiting engineers, accident analysis, Pacific logistics), but life stuff appeared too: a child's stomach symptoms needed sorting out. The dual-track of work and parenting showed up clearly this month.</p>
-            </div>
-
-            <div class="month-narrative">
-                <div class="month-header">
-                    <span class="month-name">April</span>
-                    <span class="month-theme">New Threads</span>
-                </div>
-                <p>Aviation still central, but other things started appearing. First vermouth conversations. A traffic light alert device concept. Lost jewelry, insurance claims. Less singular focus, more variety creeping in.</p>
-            </div>
-
-            <div class="month-narrative">
-                <div class="month-header">
-                    <span class="month-name">May - June</span>
-                    <span class="month-theme">Personal Brand Work</span>
-                </div>
-                <p>Focus shifted to positioning yourself: superpower statements, bio drafts, website CSS. A lot of Ghost theme work. You were building the infrastructure for fractional consulting - how you'd present yourself to potential clients.</p>
-            </div>
-
-            <div class="month-narrative">
-                <div class="month-header">
-                    <span class="month-name">July - August</span>
-                    <span class="month-theme">Quiet Transition</span>
-                </div>
-                <p>Only 24 conversations across two months - noticeably slower. You were splitting time more aggressively between Claude and ChatGPT during this period. The conversations that happened were about Duckbill marketing, consulting landing pages, new client work. A pivot was underway, just not a loud one.</p>
-            </div>
-
-            <div class="month-narrative">
-                <div class="month-header">
-                    <span class="month-name">September</span>
-                    <span class="month-theme">The ChatGPT Experiment</span>
-                </div>
-                <p><strong>1 conversation</strong>. You switched to ChatGPT almost exclusively for the month - an experiment in the other direction. The lone Claude conversation that month was brief. This is the gap in the chart.</p>
-            </div>
-
-            <div class="month-narrative">
-                <div class="month-header">
-                    <span class="month-name">October</span>
-                    <span class="month-theme">Back to Claude, Full Throttle</span>
-                </div>
-                <p><strong>119 conversations</strong> - you came back from the ChatGPT experiment and went all-in on Claude. Duckbill work dominated (74 mentions), but you were also into fitness tracking, food logging apps, parenting stuff, vermouth experiments. A lot of plates spinning simultaneously.</p>
-            </div>
-
-            <div class="month-narrative">
-                <div class="month-header">
-                    <span class="month-name">November</span>
-                    <span class="month-theme">Peak Activity</span>
-                </div>
-                <p><strong>140 conversations</strong> - your highest month. Vermouth/Cartographer became a real focus (76 mentions). Conversations with the Four Sigmatic founder. Restaurant recommendations. Parenting. Style advice. Kid was sick. You were doing a lot of different things at once.</p>
-            </div>
-
-            <div class="month-narrative">
-                <div class="month-header">
-                    <span class="month-name">December</span>
-                    <span class="month-theme">Winding Down</span>
-                </div>
-                <p>54 conversations - slower pace. Technical projects, partnership thinking, this Wrapped analysis. More reflection than execution. Setting up for next year rather than sprinting to finish this one.</p>
-            </div>
+            $month_narratives
         </section>
 
         <section class="section">
@@ -943,95 +1003,263 @@ def generate_html():
         </footer>
     </div>
 
-    <script>
-        // Detect dark mode and set chart colors accordingly
-        const isDark = window.matchMedia('(prefers-color-scheme: dark)').matches;
-        const textColor = isDark ? '#a8a29e' : '#57534e';
-        const gridColor = isDark ? 'rgba(255, 255, 255, 0.08)' : 'rgba(0, 0, 0, 0.06)';
-        const accentColor = isDark ? 'rgba(218, 112, 44, 1)' : 'rgba(203, 97, 32, 1)';
-        const accentBg = isDark ? 'rgba(218, 112, 44, 0.85)' : 'rgba(203, 97, 32, 0.85)';
-        const accentFill = isDark ? 'rgba(218, 112, 44, 0.2)' : 'rgba(203, 97, 32, 0.12)';
-        const pointBorder = isDark ? '#242220' : '#fff';
-
-        Chart.defaults.color = textColor;
-        Chart.defaults.borderColor = gridColor;
-
-        // Months chart
-        new Chart(document.getElementById('monthsChart'), {{
-            type: 'bar',
-            data: {{
-                labels: {json.dumps(months_labels)},
-                datasets: [{{
-                    label: 'Conversations',
-                    data: {json.dumps(months_values)},
-                    backgroundColor: accentBg,
-                    borderColor: accentColor,
-                    borderWidth: 1,
-                    borderRadius: 4
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{ display: false }}
-                }},
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        grid: {{ color: gridColor }}
-                    }},
-                    x: {{
-                        grid: {{ display: false }}
-                    }}
-                }}
-            }}
-        }});
-
-        // Hours chart
-        new Chart(document.getElementById('hoursChart'), {{
-            type: 'line',
-            data: {{
-                labels: {json.dumps(hours_labels)},
-                datasets: [{{
-                    label: 'Messages',
-                    data: {json.dumps(hours_values)},
-                    fill: true,
-                    backgroundColor: accentFill,
-                    borderColor: accentColor,
-                    tension: 0.4,
-                    pointBackgroundColor: accentColor,
-                    pointBorderColor: pointBorder,
-                    pointRadius: 3
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{ display: false }}
-                }},
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        grid: {{ color: gridColor }}
-                    }},
-                    x: {{
-                        grid: {{ display: false }}
-                    }}
-                }}
-            }}
-        }});
-    </script>
 </body>
 </html>
 """
 
+# Placeholders whose values are fixed at import
+STATIC_CONTEXT = {"css": CSS, "favicon": FAVICON, "month_narratives": MONTH_NARRATIVES_HTML}
+
+def compile_section(part):
+    """Parse one section of HTML_SOURCE; sections that only use STATIC_CONTEXT
+    (the <head>, the narrative) are rendered to a plain string once, here."""
+    template = Template(minify_html(part))
+    try:
+        return template.substitute(STATIC_CONTEXT)
+    except KeyError:
+        return template
+
+# HTML_SOURCE parsed once at import, split before each <section> so the page
+# can be written out a section at a time instead of as one big string
+HTML_SECTIONS = tuple(compile_section(part) for part in re.split(r"(?=\n        <section )", HTML_SOURCE))
+
+# Chart geometry, in SVG user units; the SVG scales to its .chart-container
+CHART_WIDTH, CHART_HEIGHT = 400, 280
+CHART_LEFT, CHART_RIGHT, CHART_TOP, CHART_BOTTOM = 36, 8, 8, 24
+# Line charts with more points than this are thinned with lttb() first
+LINE_MAX_POINTS = 120
+
+def nice_ticks(max_value, count=5):
+    # Round the axis up to 1/2/5 x 10^n steps, like Chart.js's linear scale
+    max_value = max(max_value, 1)
+    raw = max_value / count
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw)
+    return [step * i for i in range(math.ceil(max_value / step) + 1)]
+
+def lttb(values, threshold):
+    """Largest-Triangle-Three-Buckets: indices of `threshold` points that keep
+    the visual shape of `values` (x is the index). Returns every index when
+    there is nothing to thin, e.g. the 24-hour chart."""
+    n = len(values)
+    if threshold >= n or threshold < 3:
+        return range(n)
+    every = (n - 2) / (threshold - 2)
+    keep = [0]
+    a = 0
+    for i in range(threshold - 2):
+        start, end = int(i * every) + 1, int((i + 1) * every) + 1
+        # The next bucket's average is the third corner of the triangle
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = (end + next_end - 1) / 2
+        avg_y = sum(values[end:next_end]) / (next_end - end)
+        ay = values[a]
+        a = max(range(start, end), key=lambda j: abs((a - avg_x) * (values[j] - ay) - (a - j) * (avg_y - ay)))
+        keep.append(a)
+    keep.append(n - 1)
+    return keep
+
+def svg_frame(labels, ticks, x_of, label_step=1):
+    # Grid lines with y-axis labels, plus the x-axis labels
+    plot_h = CHART_HEIGHT - CHART_TOP - CHART_BOTTOM
+    parts = []
+    for tick in ticks:
+        y = CHART_TOP + plot_h * (1 - tick / ticks[-1])
+        parts.append(f'<line class="grid" x1="{CHART_LEFT}" x2="{CHART_WIDTH - CHART_RIGHT}" y1="{y:.1f}" y2="{y:.1f}"/>')
+        parts.append(f'<text class="axis-label" x="{CHART_LEFT - 6}" y="{y + 3:.1f}" text-anchor="end">{tick:g}</text>')
+    for i in range(0, len(labels), label_step):
+        parts.append(f'<text class="axis-label" x="{x_of(i):.1f}" y="{CHART_HEIGHT - 6}" text-anchor="middle">{escape(labels[i])}</text>')
+    return parts
+
+def svg_chart(label, parts):
+    return (f'<svg class="chart-svg" viewBox="0 0 {CHART_WIDTH} {CHART_HEIGHT}" role="img" aria-label="{label}">'
+            + "".join(parts) + "</svg>")
+
+@lru_cache(maxsize=32)
+def render_bar_svg(label, labels, values):
+    # Takes tuples so unchanged data is rendered only once per process
+    ticks = nice_ticks(max(values, default=0))
+    plot_w = CHART_WIDTH - CHART_LEFT - CHART_RIGHT
+    plot_h = CHART_HEIGHT - CHART_TOP - CHART_BOTTOM
+    band = plot_w / max(len(values), 1)
+    def x_of(i):
+        return CHART_LEFT + band * (i + 0.5)
+    parts = svg_frame(labels, ticks, x_of)
+    bar_w = band * 0.72
+    for i, (name, value) in enumerate(zip(labels, values)):
+        h = plot_h * value / ticks[-1]
+        parts.append(f'<rect class="bar" x="{x_of(i) - bar_w / 2:.1f}" y="{CHART_TOP + plot_h - h:.1f}" '
+                     f'width="{bar_w:.1f}" height="{h:.1f}" rx="4"><title>{escape(name)}: {value:,}</title></rect>')
+    return svg_chart(label, parts)
+
+@lru_cache(maxsize=32)
+def render_line_svg(label, labels, values):
+    ticks = nice_ticks(max(values, default=0))
+    plot_w = CHART_WIDTH - CHART_LEFT - CHART_RIGHT
+    plot_h = CHART_HEIGHT - CHART_TOP - CHART_BOTTOM
+    step = plot_w / max(len(values) - 1, 1)
+    def x_of(i):
+        return CHART_LEFT + step * i
+    # Label every few points so the 24 hours don't overlap
+    parts = svg_frame(labels, ticks, x_of, label_step=math.ceil(len(labels) / 8) or 1)
+    # Dense series are thinned to LINE_MAX_POINTS; kept points stay at their
+    # original x, and the axis labels still come from the full series
+    keep = lttb(values, LINE_MAX_POINTS)
+    points = [(x_of(i), CHART_TOP + plot_h * (1 - values[i] / ticks[-1])) for i in keep]
+    if points:
+        line = " ".join(f"{x:.1f},{y:.1f}" for x, y in points)
+        base = CHART_TOP + plot_h
+        parts.append(f'<polygon class="area" points="{points[0][0]:.1f},{base} {line} {points[-1][0]:.1f},{base}"/>')
+        parts.append(f'<polyline class="line" points="{line}"/>')
+    for (x, y), i in zip(points, keep):
+        parts.append(f'<circle class="point" cx="{x:.1f}" cy="{y:.1f}" r="4"><title>{escape(labels[i])}: {values[i]:,}</title></circle>')
+    return svg_chart(label, parts)
+
+def render_section(section, context):
+    return section if isinstance(section, str) else section.substitute(context)
+
+def write_html(out, context):
+    for section in HTML_SECTIONS:
+        out.write(render_section(section, context))
+
+def render_html(context):
+    return "".join([render_section(section, context) for section in HTML_SECTIONS])
+
+def write_if_changed(path, data):
+    """Write `data` unless `path` already holds exactly these bytes, so an
+    unchanged regeneration leaves the file (and any file watchers) alone.
+    Returns True if the file was written."""
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+def generate_html(out=None):
+    wrapped = load_wrapped()
+    stats = load_stats()
+
+    # Prepare data for charts
+    months_data = stats.get("conversations_by_month", {})
+    # analyze.py writes the months in calendar order
+    sorted_months = list(months_data.items())
+    month_abbrevs = {
+        "01": "Jan", "02": "Feb", "03": "Mar", "04": "Apr",
+        "05": "May", "06": "Jun", "07": "Jul", "08": "Aug",
+        "09": "Sep", "10": "Oct", "11": "Nov", "12": "Dec"
+    }
+    months_labels = [month_abbrevs.get(m[0].split("-")[1], m[0]) for m in sorted_months]
+    months_values = [m[1] for m in sorted_months]
+
+    hours_data = stats.get("messages_by_hour", {})
+    def format_hour(h):
+        if h == 0:
+            return "12am"
+        elif h < 12:
+            return f"{h}am"
+        elif h == 12:
+            return "12pm"
+        else:
+            return f"{h-12}pm"
+    hours_labels = [format_hour(h) for h in range(24)]
+    hours_values = [hours_data.get(str(h), 0) for h in range(24)]
+
+    weekday_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+    weekday_data = stats.get("messages_by_weekday", {})
+    weekday_values = [weekday_data.get(d, 0) for d in weekday_order]
+
+    topics = wrapped.get("top_topics", [])
+    topic_labels = [t[0] for t in topics]
+    topic_values = [t[1] for t in topics]
+    # Bars are scaled to the largest topic; computed once, not per row
+    topic_max = max(topic_values, default=0) or 1
+
+    headline, comparisons, insights, peak, time_patterns, records, carbon = (
+        load_section(cls, wrapped.get(key, {})) for key, cls in WRAPPED_SECTIONS.items()
+    )
+
+    # List comprehensions, so str.join can size the result in one pass
+    topic_items = minify_html("".join([f'''
+                <div class="topic-item">
+                    <div class="topic-rank">{i+1}</div>
+                    <div class="topic-bar">
+                        <div class="topic-fill" style="width: {min(100, t[1] / topic_max * 100)}%">
+                            <span class="topic-name">{t[0]}</span>
+                        </div>
+                        <span class="topic-count">{t[1]} convos</span>
+                    </div>
+                </div>
+                ''' for i, t in enumerate(topics)]))
+
+    longest_convo_items = minify_html("".join([f'''
+                <div class="convo-item">
+                    <span class="convo-name">{c['name'][:60]}...</span>
+                    <span class="convo-msgs">{c['messages']} msgs</span>
+                </div>
+                ''' for c in records.top_5_longest[:5]]))
+
+    months_chart = render_bar_svg("Conversations by month", tuple(months_labels), tuple(months_values))
+    hours_chart = render_line_svg("Messages by hour", tuple(hours_labels), tuple(hours_values))
+
+    context = {
+        **STATIC_CONTEXT,
+        "total_conversations": headline.total_conversations,
+        "total_messages": f"{headline.total_messages:,}",
+        "total_words_you_wrote": f"{headline.total_words_you_wrote:,}",
+        "total_words_claude_wrote": f"{headline.total_words_claude_wrote:,}",
+        "projects_used": headline.projects_used,
+        "total_words_exchanged": f"{headline.total_words_exchanged:,}",
+        "equivalent_novels": comparisons.equivalent_novels,
+        "pages_of_text": f"{comparisons.pages_of_text:,}",
+        "hours_of_audiobook": comparisons.hours_of_audiobook,
+        "gatsby_equivalents": comparisons.the_great_gatsby_equivalents,
+        "topic_items": topic_items,
+        "chronotype": time_patterns.chronotype,
+        "favorite_hour": peak.favorite_hour,
+        "favorite_day": peak.favorite_day,
+        "communication_style": insights.your_communication_style,
+        "quick_chats": insights.quick_chats,
+        "deep_dives": insights.deep_dives,
+        "verbosity_ratio": insights.claude_verbosity_ratio,
+        "weekend_percentage": time_patterns.weekend_percentage,
+        "busiest_month": records.busiest_month,
+        "busiest_month_convos": records.busiest_month_convos,
+        "usage_trend": records.usage_trend,
+        "longest_convo_items": longest_convo_items,
+        "message_pairs": f"{carbon.message_pairs:,}",
+        "total_co2_kg": carbon.total_co2_kg,
+        "operational_co2_kg": carbon.operational_co2_kg,
+        "training_co2_kg": carbon.training_co2_kg,
+        "car_miles": f"{int(carbon.car_miles_equivalent):,}",
+        "water_liters": f"{int(carbon.water_liters):,}",
+        "showers_equivalent": carbon.showers_equivalent,
+        "operational_kwh": carbon.operational_kwh,
+        "offset_cost": f"{carbon.offset_cost_usd:.2f}",
+        "months_chart": months_chart,
+        "hours_chart": hours_chart,
+    }
+
+    # Any text stream works, e.g. gzip.open("wrapped.html.gz", "wt")
+    if out is not None:
+        write_html(out, context)
+        return
+
+    # Encoded once and shared by both files: one write each, no text-mode
+    # codec or newline translation
+    data = render_html(context).encode("utf-8")
     output_path = OUTPUT_DIR / "wrapped.html"
-    with open(output_path, "w") as f:
-        f.write(html)
+    changed = write_if_changed(output_path, data)
+
+    # Precompressed copy for servers that can send .gz as-is; mtime=0 keeps
+    # the bytes identical across runs when the page hasn't changed, so it is
+    # only recompressed when the page did (or the .gz is missing)
+    gz_path = output_path.with_name(output_path.name + ".gz")
+    if changed or not gz_path.exists():
+        gz_path.write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
 
-    print(f"HTML report generated: {output_path}")
+    print(f"HTML report generated: {output_path}" + ("" if changed else " (unchanged)"))
     return output_path
 
 if __name__ == "__main__":